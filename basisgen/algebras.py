@@ -1,11 +1,71 @@
 from basisgen.weights import Weight
+from basisgen.cache import cached
 
 import abc
 import collections
 import enum
 import functools
 import itertools
+import math
 import operator
+from fractions import Fraction
+
+
+_MAX_TABULATED_WEYL_GROUP_ORDER = 100000
+
+
+def _lcm(first, second):
+    return first * second // math.gcd(first, second)
+
+
+AlgebraData = collections.namedtuple(
+    'AlgebraData',
+    [
+        'cartan_matrix',
+        'simple_roots',
+        'integer_metric',
+        'metric_denominator',
+        'positive_roots',
+        'rho',
+        'level_vector'
+    ]
+)
+
+
+def _positive_roots(cartan_matrix):
+    rank = len(cartan_matrix)
+    simple_roots = [Weight(row) for row in cartan_matrix]
+    unit_vectors = [
+        tuple(int(i == j) for j in range(rank)) for i in range(rank)
+    ]
+
+    # Roots are indexed by their coordinates in the simple root basis
+    roots = dict(zip(unit_vectors, simple_roots))
+    current_roots = dict(roots)
+    levels = [sorted(simple_roots)]
+
+    while current_roots:
+        previous_roots = current_roots
+        current_roots = {}
+
+        for coordinates, root in previous_roots.items():
+            for index, simple_root in enumerate(simple_roots):
+                lowered = list(coordinates)
+                lowered[index] -= 1
+                depth = 0
+                while tuple(lowered) in roots:
+                    depth += 1
+                    lowered[index] -= 1
+
+                if depth > root[index]:
+                    raised = list(coordinates)
+                    raised[index] += 1
+                    current_roots[tuple(raised)] = root + simple_root
+
+        roots.update(current_roots)
+        levels.append(sorted(current_roots.values()))
+
+    return tuple(itertools.chain.from_iterable(reversed(levels)))
 
 
 class Series(enum.Enum):
@@ -37,8 +97,130 @@ class Algebra(metaclass=abc.ABCMeta):
     def level_vector(self):
         pass
 
+    @property
+    @functools.lru_cache(maxsize=None)
+    def data(self):
+        return AlgebraData(
+            cartan_matrix=tuple(map(tuple, self.cartan_matrix)),
+            simple_roots=tuple(map(Weight, self.cartan_matrix)),
+            integer_metric=tuple(map(tuple, self.integer_metric)),
+            metric_denominator=self.metric_denominator,
+            positive_roots=self._positive_roots(),
+            rho=self.sum_of_positive_roots,
+            level_vector=Weight(self.level_vector)
+        )
+
     def height(self, weight):
-        return sum(map(operator.mul, self.level_vector, weight))
+        return sum(map(operator.mul, self.data.level_vector, weight))
+
+    @property
+    def simple_roots(self):
+        return list(self.data.simple_roots)
+
+    def reflect(self, weight, index):
+        component = weight[index]
+        return Weight(
+            weight_component - component * root_component
+            for weight_component, root_component
+            in zip(weight, self.data.simple_roots[index])
+        )
+
+    def reflect_to_dominant(self, weight):
+        sign = 1
+        while True:
+            index = next(
+                (i for i, component in enumerate(weight) if component < 0),
+                None
+            )
+            if index is None:
+                return weight, sign
+
+            weight = self.reflect(weight, index)
+            sign = -sign
+
+    def weyl_orbit(self, dominant_weight):
+        orbit = [dominant_weight]
+        current_weights = {dominant_weight}
+
+        while current_weights:
+            previous_weights = current_weights
+            current_weights = set()
+
+            for weight in previous_weights:
+                for index, component in enumerate(weight):
+                    if component > 0:
+                        current_weights.add(self.reflect(weight, index))
+
+            orbit.extend(current_weights)
+
+        return orbit
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def weyl_denominator(self):
+        # Maps w(rho) - rho to the sign of w, for every Weyl group element w
+        rho = self.data.rho
+        signs = {rho: 1}
+        current_weights = [rho]
+
+        while current_weights:
+            previous_weights = current_weights
+            current_weights = []
+
+            for weight in previous_weights:
+                for index in range(self.rank):
+                    reflected = self.reflect(weight, index)
+                    if reflected not in signs:
+                        signs[reflected] = -signs[weight]
+                        current_weights.append(reflected)
+
+        return {weight - rho: sign for weight, sign in signs.items()}
+
+    @property
+    def has_tabulated_weyl_denominator(self):
+        return self.weyl_group_order <= _MAX_TABULATED_WEYL_GROUP_ORDER
+
+    @cached('Algebra.root_coordinates')
+    def root_coordinates(self, weight):
+        return tuple(
+            sum(
+                component * row[index]
+                for component, row in zip(weight, self.inverse_cartan_matrix)
+            )
+            for index in range(self.rank)
+        )
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def root_coordinates_denominator(self):
+        return functools.reduce(
+            _lcm,
+            (element.denominator
+             for row in self.inverse_cartan_matrix
+             for element in row),
+            1
+        )
+
+    @cached('Algebra.scaled_root_coordinates')
+    def scaled_root_coordinates(self, weight):
+        return tuple(
+            int(coordinate * self.root_coordinates_denominator)
+            for coordinate in self.root_coordinates(weight)
+        )
+
+    def congruence_class(self, weight):
+        return tuple(
+            coordinate % 1 for coordinate in self.root_coordinates(weight)
+        )
+
+    def singlet_sign(self, weight):
+        if self.has_tabulated_weyl_denominator:
+            return self.weyl_denominator.get(weight, 0)
+
+        rho = self.data.rho
+        dominant_weight, sign = self.reflect_to_dominant(weight + rho)
+
+        return sign if dominant_weight == rho else 0
 
 
 class SimpleAlgebra(Algebra):
@@ -57,11 +239,25 @@ class SimpleAlgebra(Algebra):
                 )
             )
 
-    def __init__(self, series, rank):
-        SimpleAlgebra._check_rank_bounds(series, rank)
+    _instances = {}
+
+    def __new__(cls, series, rank):
+        key = (series, rank)
+        instance = SimpleAlgebra._instances.get(key)
+
+        if instance is None:
+            SimpleAlgebra._check_rank_bounds(series, rank)
+
+            instance = super().__new__(cls)
+            instance.series = series
+            instance.rank = rank
+            instance._hash = hash(key)
+            SimpleAlgebra._instances[key] = instance
 
-        self.series = series
-        self.rank = rank
+        return instance
+
+    def __reduce__(self):
+        return SimpleAlgebra, (self.series, self.rank)
 
     @staticmethod
     def _check_rank_bounds(series, rank):
@@ -86,13 +282,7 @@ class SimpleAlgebra(Algebra):
     __repr__ = __str__
 
     def __hash__(self):
-        return hash((self.series, self.rank))
-
-    def __eq__(self, other):
-        if not isinstance(other, SimpleAlgebra):
-            return False
-        else:
-            return self.series == other.series and self.rank == other.rank
+        return self._hash
 
     def __add__(self, other):
         return self._to_semisimple() + other._to_semisimple()
@@ -101,6 +291,7 @@ class SimpleAlgebra(Algebra):
         return SemisimpleAlgebra([self])
 
     @property
+    @functools.lru_cache(maxsize=None)
     def cartan_matrix(self):
         def default_element(i, j):
             return {0: 2, 1: -1}.get(abs(i - j), 0)
@@ -136,10 +327,6 @@ class SimpleAlgebra(Algebra):
 
         return generic_cartan_matrix(exceptional_elements)
 
-    @property
-    def simple_roots(self):
-        return list(map(Weight, self.cartan_matrix))
-
     @property
     @functools.lru_cache(maxsize=None)
     def highest_root(self):
@@ -149,7 +336,9 @@ class SimpleAlgebra(Algebra):
             )
 
         if self.series == Series.B:
-            return Weight([0, 1] + [0] * (self.rank - 2))
+            return Weight(
+                [0, 1] + [0] * (self.rank - 2) if self.rank > 2 else [0, 2]
+            )
 
         if self.series == Series.C:
             return Weight([2] + [0] * (self.rank - 1))
@@ -191,30 +380,59 @@ class SimpleAlgebra(Algebra):
 
     @property
     @functools.lru_cache(maxsize=None)
-    def metric(self):
-        if self.series == Series.E and self.rank == 6:
+    def weyl_group_order(self):
+        n = self.rank
+
+        if self.series == Series.A:
+            return math.factorial(n + 1)
+
+        if self.series in (Series.B, Series.C):
+            return 2**n * math.factorial(n)
+
+        if self.series == Series.D:
+            return 2**(n - 1) * math.factorial(n)
+
+        if self.series == Series.E:
+            return {6: 51840, 7: 2903040, 8: 696729600}[n]
+
+        if self.series == Series.F:
+            return 1152
+
+        if self.series == Series.G:
+            return 12
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def _exact_metric(self):
+        def scaled_matrix(numerators, denominator):
             return [
-                [4/3,  5/3,  6/3,  4/3,  2/3,  3/3],
-                [5/3, 10/3, 12/3,  8/3,  4/3,  6/3],
-                [6/3, 12/3, 18/3, 12/3,  6/3,  9/3],
-                [4/3,  8/3, 12/3, 10/3,  5/3,  6/3],
-                [2/3,  4/3,  6/3,  5/3,  4/3,  3/3],
-                [3/3,  6/3,  9/3,  6/3,  3/3,  6/3]
+                [Fraction(numerator, denominator) for numerator in row]
+                for row in numerators
             ]
 
+        if self.series == Series.E and self.rank == 6:
+            return scaled_matrix([
+                [4,  5,  6,  4,  2, 3],
+                [5, 10, 12,  8,  4, 6],
+                [6, 12, 18, 12,  6, 9],
+                [4,  8, 12, 10,  5, 6],
+                [2,  4,  6,  5,  4, 3],
+                [3,  6,  9,  6,  3, 6]
+            ], 3)
+
         if self.series == Series.E and self.rank == 7:
-            return [
-                [4/2,  6/2,  8/2,  6/2,  4/2,  2/2,  4/2],
-                [6/2, 12/2, 16/2, 12/2,  8/2,  4/2,  8/2],
-                [8/2, 16/2, 24/2, 18/2, 12/2,  6/2, 12/2],
-                [6/2, 12/2, 18/2, 15/2, 10/2,  5/2,  9/2],
-                [4/2,  8/2, 12/2, 10/2,  8/2,  4/2,  6/2],
-                [2/2,  4/2,  6/2,  5/2,  4/2,  3/2,  3/2],
-                [4/2,  8/2, 12/2,  9/2,  6/2,  3/2,  7/2]
-            ]
+            return scaled_matrix([
+                [4,  6,  8,  6,  4, 2,  4],
+                [6, 12, 16, 12,  8, 4,  8],
+                [8, 16, 24, 18, 12, 6, 12],
+                [6, 12, 18, 15, 10, 5,  9],
+                [4,  8, 12, 10,  8, 4,  6],
+                [2,  4,  6,  5,  4, 3,  3],
+                [4,  8, 12,  9,  6, 3,  7]
+            ], 2)
 
         if self.series == Series.E and self.rank == 8:
-            return [
+            return scaled_matrix([
                 [4,   7, 10,  8,  6,  4,  2,  5],
                 [7,  14, 20, 16, 12,  8,  4, 10],
                 [10, 20, 30, 24, 18, 12,  6, 15],
@@ -223,21 +441,21 @@ class SimpleAlgebra(Algebra):
                 [4,   8, 12, 10,  8,  6,  3,  6],
                 [2,   4,  6,  5,  4,  3,  2,  3],
                 [5,  10, 15, 12,  9,  6,  3,  8]
-            ]
+            ], 1)
 
         if self.series == Series.F:
-            return [
-                [2, 3,   2,   1],
-                [3, 6,   4,   2],
-                [2, 4,   3, 3/2],
-                [1, 2, 3/2,   1]
-            ]
+            return scaled_matrix([
+                [4,  6, 4, 2],
+                [6, 12, 8, 4],
+                [4,  8, 6, 3],
+                [2,  4, 3, 2]
+            ], 2)
 
         if self.series == Series.G:
-            return [
-                [2,   1],
-                [1, 2/3]
-            ]
+            return scaled_matrix([
+                [6, 3],
+                [3, 2]
+            ], 3)
 
         def build_matrix(element, size):
             return [[element(i, j) for j in range(size)] for i in range(size)]
@@ -245,30 +463,30 @@ class SimpleAlgebra(Algebra):
         n = self.rank
 
         def element_A(i, j):
-            return min(i + 1, j + 1) * (n - max(i, j)) / (n + 1)
+            return Fraction(min(i + 1, j + 1) * (n - max(i, j)), n + 1)
 
         def element_B(i, j):
             if i + 1 == n and j + 1 == n:
-                return n/4
+                return Fraction(n, 4)
             elif i + 1 == n:
-                return (j + 1)/2
+                return Fraction(j + 1, 2)
             elif j + 1 == n:
-                return (i + 1)/2
+                return Fraction(i + 1, 2)
             else:
-                return min(i + 1, j + 1)
+                return Fraction(min(i + 1, j + 1))
 
         def element_C(i, j):
-            return min(i + 1, j + 1)/2
+            return Fraction(min(i + 1, j + 1), 2)
 
         def element_D(i, j):
             if i + 1 > n - 2 and j + 1 > n - 2:
-                return n/4 if i == j else (n - 2)/4
+                return Fraction(n, 4) if i == j else Fraction(n - 2, 4)
             elif i + 1 > n - 2:
-                return (j + 1)/2
+                return Fraction(j + 1, 2)
             elif j + 1 > n - 2:
-                return (i + 1)/2
+                return Fraction(i + 1, 2)
             else:
-                return min(i + 1, j + 1)
+                return Fraction(min(i + 1, j + 1))
 
         element = {
             Series.A: element_A,
@@ -279,15 +497,72 @@ class SimpleAlgebra(Algebra):
 
         return build_matrix(element, n)
 
+    @property
     @functools.lru_cache(maxsize=None)
-    def scalar_product(self, first_weight, second_weight):
+    def metric(self):
+        return [list(map(float, row)) for row in self._exact_metric]
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def inverse_cartan_matrix(self):
+        metric = self._exact_metric
+        half_root_norms = [
+            sum(
+                element * metric[j][i]
+                for j, element in enumerate(self.cartan_matrix[i])
+            )
+            for i in range(self.rank)
+        ]
+
+        return [
+            [
+                element / half_root_norm
+                for element, half_root_norm in zip(row, half_root_norms)
+            ]
+            for row in metric
+        ]
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def metric_denominator(self):
+        return functools.reduce(
+            _lcm,
+            (element.denominator
+             for row in self._exact_metric
+             for element in row),
+            1
+        )
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def integer_metric(self):
+        return [
+            [int(element * self.metric_denominator) for element in row]
+            for row in self._exact_metric
+        ]
+
+    def _positive_roots(self):
+        return _positive_roots(self.cartan_matrix)
+
+    @cached('SimpleAlgebra.scaled_scalar_product')
+    def scaled_scalar_product(self, first_weight, second_weight):
         return sum(
             first_component * metric_element * second_component
-            for first_component, row in zip(first_weight, self.metric)
+            for first_component, row
+            in zip(first_weight, self.data.integer_metric)
             for metric_element, second_component in zip(row, second_weight)
         )
 
-    @functools.lru_cache(maxsize=None)
+    @cached('SimpleAlgebra.scaled_norm_squared')
+    def scaled_norm_squared(self, weight):
+        return self.scaled_scalar_product(weight, weight)
+
+    def scalar_product(self, first_weight, second_weight):
+        return Fraction(
+            self.scaled_scalar_product(first_weight, second_weight),
+            self.metric_denominator
+        )
+
     def norm_squared(self, weight):
         return self.scalar_product(weight, weight)
 
@@ -336,11 +611,25 @@ class SimpleAlgebra(Algebra):
 
 
 class SemisimpleAlgebra(collections.Iterable, Algebra):
-    def __init__(self, simple_algebras):
-        self.simple_algebras = simple_algebras
-        self.rank = sum(
-            simple_algebra.rank for simple_algebra in simple_algebras
-        )
+    _instances = {}
+
+    def __new__(cls, simple_algebras):
+        key = tuple(simple_algebras)
+        instance = SemisimpleAlgebra._instances.get(key)
+
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.simple_algebras = list(key)
+            instance.rank = sum(
+                simple_algebra.rank for simple_algebra in key
+            )
+            instance._hash = hash(key)
+            SemisimpleAlgebra._instances[key] = instance
+
+        return instance
+
+    def __reduce__(self):
+        return SemisimpleAlgebra, (self.simple_algebras,)
 
     def __str__(self):
         return " + ".join(map(str, self.simple_algebras))
@@ -348,16 +637,7 @@ class SemisimpleAlgebra(collections.Iterable, Algebra):
     __repr__ = __str__
 
     def __hash__(self):
-        return hash(tuple(self.simple_algebras))
-
-    def __eq__(self, other):
-        if not isinstance(other, SemisimpleAlgebra):
-            return False
-        else:
-            return all(
-                self_algebra == other_algebra
-                for self_algebra, other_algebra in zip(self, other)
-            )
+        return self._hash
 
     def __add__(self, other):
         return SemisimpleAlgebra(
@@ -393,6 +673,102 @@ class SemisimpleAlgebra(collections.Iterable, Algebra):
     def join_weights(self, weights):
         return Weight(itertools.chain.from_iterable(weights))
 
+    @property
+    @functools.lru_cache(maxsize=None)
+    def cartan_matrix(self):
+        matrix = []
+        offset = 0
+
+        for simple_algebra in self:
+            for row in simple_algebra.cartan_matrix:
+                matrix.append(
+                    [0] * offset
+                    + row
+                    + [0] * (self.rank - offset - simple_algebra.rank)
+                )
+            offset += simple_algebra.rank
+
+        return matrix
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def inverse_cartan_matrix(self):
+        matrix = []
+        offset = 0
+
+        for simple_algebra in self:
+            for row in simple_algebra.inverse_cartan_matrix:
+                matrix.append(
+                    [Fraction(0)] * offset
+                    + row
+                    + [Fraction(0)] * (
+                        self.rank - offset - simple_algebra.rank
+                    )
+                )
+            offset += simple_algebra.rank
+
+        return matrix
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def metric_denominator(self):
+        return functools.reduce(
+            _lcm,
+            (simple_algebra.metric_denominator for simple_algebra in self),
+            1
+        )
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def integer_metric(self):
+        matrix = []
+        offset = 0
+
+        for simple_algebra in self:
+            scale = (
+                self.metric_denominator // simple_algebra.metric_denominator
+            )
+            for row in simple_algebra.integer_metric:
+                matrix.append(
+                    [0] * offset
+                    + [scale * element for element in row]
+                    + [0] * (self.rank - offset - simple_algebra.rank)
+                )
+            offset += simple_algebra.rank
+
+        return matrix
+
+    def _positive_roots(self):
+        positive_roots = []
+        offset = 0
+
+        for simple_algebra in self:
+            positive_roots.extend(
+                Weight(
+                    [0] * offset
+                    + list(root)
+                    + [0] * (self.rank - offset - simple_algebra.rank)
+                )
+                for root in simple_algebra.data.positive_roots
+            )
+            offset += simple_algebra.rank
+
+        return tuple(positive_roots)
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def sum_of_positive_roots(self):
+        return Weight([1] * self.rank)
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def weyl_group_order(self):
+        return functools.reduce(
+            operator.mul,
+            (simple_algebra.weyl_group_order for simple_algebra in self),
+            1
+        )
+
     @property
     @functools.lru_cache(maxsize=None)
     def level_vector(self):
@@ -0,0 +1,323 @@
+import atexit
+import collections
+import contextlib
+import functools
+import multiprocessing.util
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+
+CACHE_VERSION = 1
+
+DEFAULT_MAXSIZE = 65536
+DEFAULT_WEIGHTS_MAXSIZE = 1000000
+
+_MISSING = object()
+
+
+CacheStatistics = collections.namedtuple(
+    'CacheStatistics',
+    ['hits', 'misses', 'evictions', 'size', 'cost', 'maxsize']
+)
+
+
+class Cache(object):
+    def __init__(self, name, maxsize=DEFAULT_MAXSIZE, cost=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.cost = cost
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_cost = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value):
+        entry_cost = 1 if self.cost is None else self.cost(value)
+
+        with self._lock:
+            if key in self._entries:
+                self.total_cost -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, entry_cost)
+            self.total_cost += entry_cost
+            self._evict()
+
+    def _evict(self):
+        while (
+                self.maxsize is not None
+                and self.total_cost > self.maxsize
+                and self._entries
+        ):
+            _, (_, entry_cost) = self._entries.popitem(last=False)
+            self.total_cost -= entry_cost
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_cost = 0
+
+    def statistics(self):
+        return CacheStatistics(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            cost=self.total_cost,
+            maxsize=self.maxsize
+        )
+
+
+_caches = {}
+
+
+def get_cache(name, maxsize=DEFAULT_MAXSIZE, cost=None):
+    if name not in _caches:
+        _caches[name] = Cache(name, maxsize, cost)
+
+    return _caches[name]
+
+
+def cached(name, maxsize=DEFAULT_MAXSIZE, cost=None):
+    cache = get_cache(name, maxsize, cost)
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items())) if kwargs else args
+            result = cache.get(key, _MISSING)
+
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.set(key, result)
+
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def cache_statistics():
+    return {name: cache.statistics() for name, cache in _caches.items()}
+
+
+def set_cache_limit(name, maxsize):
+    _caches[name].resize(maxsize)
+
+
+def clear_caches(*names):
+    for name in names or list(_caches):
+        _caches[name].clear()
+
+
+class PersistentCache(object):
+    def __init__(self, path, max_entries=100000):
+        self.path = path
+        self.max_entries = max_entries
+        self._connection = None
+        self._pid = None
+        self._finalized_pid = None
+        self._used_keys = set()
+
+    @property
+    def connection(self):
+        if self._connection is None or self._pid != os.getpid():
+            if self._pid != os.getpid():
+                self._used_keys = set()
+
+            # Statements commit on their own unless run in _transaction
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=60,
+                isolation_level=None
+            )
+            self._pid = os.getpid()
+            self._prepare()
+
+            if self._finalized_pid != self._pid:
+                multiprocessing.util.Finalize(
+                    None,
+                    self.close,
+                    exitpriority=10
+                )
+                self._finalized_pid = self._pid
+
+        return self._connection
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transaction(connection):
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _prepare(self):
+        connection = self._connection
+        connection.execute("PRAGMA journal_mode=WAL")
+
+        with self._transaction(connection):
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata "
+                "(key TEXT PRIMARY KEY, value TEXT)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB, last_used REAL)"
+            )
+
+            row = connection.execute(
+                "SELECT value FROM metadata WHERE key = 'version'"
+            ).fetchone()
+
+            if row is None or row[0] != str(CACHE_VERSION):
+                connection.execute("DELETE FROM entries")
+                connection.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES ('version', ?)",
+                    (str(CACHE_VERSION),)
+                )
+
+    def __len__(self):
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM entries"
+        ).fetchone()[0]
+
+    def get(self, key):
+        row = self.connection.execute(
+            "SELECT value FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(key)
+
+        # The access time is written by flush, so reads never take the lock
+        self._used_keys.add(key)
+
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+            (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), time.time())
+        )
+
+    def _evict(self, connection):
+        excess = connection.execute(
+            "SELECT COUNT(*) FROM entries"
+        ).fetchone()[0] - self.max_entries
+
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries "
+                "ORDER BY last_used, rowid LIMIT ?)",
+                (excess,)
+            )
+
+    def flush(self):
+        if self._connection is None or self._pid != os.getpid():
+            return
+
+        now = time.time()
+        with self._transaction(self._connection) as connection:
+            connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                ((now, key) for key in self._used_keys)
+            )
+            self._evict(connection)
+        self._used_keys.clear()
+
+    def clear(self):
+        self.connection.execute("DELETE FROM entries")
+        self._used_keys.clear()
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self.flush()
+            self._connection.close()
+        self._connection = None
+
+
+_persistent_cache = None
+
+
+def enable_persistent_cache(path, max_entries=100000):
+    global _persistent_cache
+
+    disable_persistent_cache()
+    _persistent_cache = PersistentCache(path, max_entries)
+
+    return _persistent_cache
+
+
+def disable_persistent_cache():
+    global _persistent_cache
+
+    if _persistent_cache is not None:
+        _persistent_cache.close()
+    _persistent_cache = None
+
+
+def release_persistent_cache():
+    if _persistent_cache is not None:
+        _persistent_cache.close()
+
+
+atexit.register(disable_persistent_cache)
+
+
+def persistent(name, encode, decode):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            cache = _persistent_cache
+            if cache is None:
+                return function(*args, **kwargs)
+
+            key = repr((name,) + args + tuple(sorted(kwargs.items())))
+            try:
+                value = cache.get(key)
+            except KeyError:
+                result = function(*args, **kwargs)
+                cache.set(key, encode(result))
+                return result
+
+            return decode(value, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,40 @@
+import json
+import os
+
+
+class Checkpoint(object):
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, settings):
+        settings = list(settings)
+        results = {}
+
+        if not os.path.exists(self.path):
+            return results
+
+        with open(self.path, 'rb+') as checkpoint_file:
+            valid_size = 0
+            for line in checkpoint_file:
+                try:
+                    record = json.loads(line.decode())
+                except ValueError:
+                    break
+
+                if not line.endswith(b'\n'):
+                    break
+
+                valid_size += len(line)
+                if record['settings'] == settings:
+                    results[record['key']] = record['result']
+
+            checkpoint_file.truncate(valid_size)
+
+        return results
+
+    def write(self, settings, key, result):
+        record = {'settings': list(settings), 'key': key, 'result': result}
+
+        with open(self.path, 'a') as checkpoint_file:
+            checkpoint_file.write(json.dumps(record) + '\n')
+            checkpoint_file.flush()
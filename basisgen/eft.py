@@ -1,16 +1,39 @@
-from basisgen.representations import Irrep, IrrepCounter
+from basisgen.representations import Irrep, IrrepCounter, WeightSystem
 from basisgen.lorentz import lorentz_algebra, vector, L_tensor, R_tensor
 from basisgen.statistics import Statistics
 from basisgen.partitions import partitions
 from basisgen.weights import Weight
+from basisgen.algebras import _lcm
+from basisgen.hilbert import GradedWeightSystem
+from basisgen.checkpoint import Checkpoint
+from basisgen.cache import (
+    get_cache, release_persistent_cache, DEFAULT_WEIGHTS_MAXSIZE
+)
+from basisgen.young import (
+    integer_partitions, conjugate_partition, littlewood_richardson,
+    schur_dimension, schur_dimension_polynomial
+)
 
 from collections import Counter
+from fractions import Fraction
+import concurrent.futures
 import functools
 import itertools
 import math
+import os
 from operator import mul
 
 
+_levels_cache = get_cache('Operator.derivative_levels')
+_graded_powers_cache = get_cache(
+    'Field.graded_power',
+    maxsize=DEFAULT_WEIGHTS_MAXSIZE,
+    cost=len
+)
+
+_MAX_RENORMALIZABLE_DIMENSION = 4
+
+
 class Field(object):
     def __init__(
             self,
@@ -79,10 +102,93 @@ class Field(object):
             for partition in partitions(exponent, self.number_of_flavors)
         )
 
+    def power_weight_systems(self, exponent):
+        return (
+            [
+                self.irrep.power_weight_system(inner_exponent, self.statistics)
+                for inner_exponent in partition
+            ]
+            for partition in partitions(exponent, self.number_of_flavors)
+        )
+
+    def flavor_weight_systems(self, exponent):
+        if self.number_of_flavors is not None:
+            return [
+                (weight_systems, None)
+                for weight_systems in self.power_weight_systems(exponent)
+            ]
+
+        return [
+            (
+                [self.irrep.schur_weight_system(partition)],
+                (
+                    self.name,
+                    partition if self.statistics == Statistics.BOSON
+                    else conjugate_partition(partition)
+                )
+            )
+            for partition in integer_partitions(exponent)
+        ]
+
     @property
     def irrep(self):
         return self.lorentz_irrep + self.internal_irrep
 
+    def conformal_character(self, max_derivatives, use_eom):
+        grades = [self.irrep.weight_system] + [
+            sum(
+                (
+                    field.irrep.weight_system
+                    for field in self.differentiate(times, use_eom)
+                ),
+                WeightSystem([])
+            )
+            for times in range(1, max_derivatives + 1)
+        ]
+
+        return GradedWeightSystem(grades, max_derivatives).scale(
+            self.number_of_flavors
+        )
+
+    def graded_power(self, exponent, max_derivatives, use_eom):
+        key = (self.signature, exponent, use_eom)
+        cached = _graded_powers_cache.get(key)
+
+        if cached is None or cached.max_grade < max_derivatives:
+            cached = self.conformal_character(
+                max_derivatives,
+                use_eom
+            ).power(exponent, self.statistics)
+            _graded_powers_cache.set(key, cached)
+
+        return cached.truncate(max_derivatives)
+
+    def _signature(self, lorentz_highest_weight, internal_irrep):
+        return (
+            str(internal_irrep.algebra),
+            lorentz_highest_weight.components,
+            internal_irrep.highest_weight.components,
+            self.statistics.value,
+            self.number_of_flavors,
+            self.dimension,
+            self.number_of_derivatives,
+            self._force_use_eom
+        )
+
+    @property
+    def signature(self):
+        return self._signature(
+            self.lorentz_irrep.highest_weight,
+            self.internal_irrep
+        )
+
+    @property
+    def conjugate_signature(self):
+        return self._signature(
+            Weight(reversed(self.lorentz_irrep.highest_weight)),
+            self.internal_irrep.conjugate
+        )
+
     def differentiate(self, times, use_eom=True):
         if use_eom or self._force_use_eom:
             highest_weight = (
@@ -197,6 +303,25 @@ class Operator(object):
 
         return [sum(charges) for charges in transposed_charges]
 
+    @property
+    def signature(self):
+        return self._oriented_signature()[0]
+
+    def _oriented_signature(self):
+        direct = tuple(sorted(
+            (field.signature, exponent)
+            for field, exponent in self.content.items()
+        ))
+        conjugate = tuple(sorted(
+            (field.conjugate_signature, exponent)
+            for field, exponent in self.content.items()
+        ))
+
+        if direct <= conjugate:
+            return direct, False
+        else:
+            return conjugate, True
+
     @property
     def is_neutral(self):
         return all(
@@ -243,26 +368,33 @@ class Operator(object):
 
     @staticmethod
     def total_derivatives(initial_irrep, max_derivatives, initial_derivatives):
-        def possible_irreps(lorentz_irrep):
-            return initial_irrep * (
-                lorentz_irrep + Irrep.singlet(initial_irrep.algebra[2:])
-            )
-
-        def vector_power(number_of_derivatives):
-            return vector.power(number_of_derivatives, Statistics.BOSON)
-
         return {
             initial_derivatives + number_of_derivatives:
-            IrrepCounter(
-                irrep
-                for lorentz_irrep in vector_power(number_of_derivatives)
-                for irrep in possible_irreps(lorentz_irrep)
+            Operator._total_derivative_irreps(
+                initial_irrep,
+                number_of_derivatives
             )
             for number_of_derivatives in range(1, max_derivatives + 1)
         }
 
+    @staticmethod
+    def _total_derivative_irreps(initial_irrep, number_of_derivatives):
+        internal_singlet = Irrep.singlet(initial_irrep.algebra[2:])
+
+        return IrrepCounter(
+            irrep
+            for lorentz_irrep in vector.power(
+                    number_of_derivatives,
+                    Statistics.BOSON
+            )
+            for irrep in initial_irrep * (lorentz_irrep + internal_singlet)
+        )
+
     @property
     def irreps(self):
+        return self.product_irreps()
+
+    def product_irreps(self, targets=None):
         possibilities = itertools.product(*(
             field.power_irreps(exponent)
             for field, exponent in self.content.items()
@@ -270,27 +402,191 @@ class Operator(object):
 
         chains = map(itertools.chain.from_iterable, possibilities)
 
+        return IrrepCounter.sum(
+            IrrepCounter.product(list(chain), targets) for chain in chains
+        )
+
+    def _internal_singlet_targets(self):
+        lorentz_highest_weight = sum(
+            (
+                exponent * field.lorentz_irrep.highest_weight
+                for field, exponent in self.content.items()
+            ),
+            Weight([0, 0])
+        )
+        internal_singlet = Irrep.singlet(
+            next(iter(self.content)).internal_irrep.algebra
+        )
+
+        return [
+            Irrep(lorentz_algebra, Weight([n, m])) + internal_singlet
+            for n in range(lorentz_highest_weight[0] + 1)
+            for m in range(lorentz_highest_weight[1] + 1)
+        ]
+
+    def _weight_system_chains(self):
+        possibilities = itertools.product(*(
+            field.power_weight_systems(exponent)
+            for field, exponent in self.content.items()
+        ))
+
+        return map(list, map(itertools.chain.from_iterable, possibilities))
+
+    @staticmethod
+    def _project_chain(chain, algebra):
+        if len(chain) == 1:
+            return chain[0].singlet_projection(algebra, 2)
+
+        chain.sort(key=lambda weight_system: len(weight_system.weights))
+        first_half = functools.reduce(mul, chain[0::2])
+        second_half = functools.reduce(mul, chain[1::2])
+
+        return first_half.product_singlet_projection(second_half, algebra, 2)
+
+    def internal_singlets_projection(self, algebra):
         return sum(
-            (functools.reduce(mul, chain) for chain in chains),
-            IrrepCounter()
+            (
+                Operator._project_chain(chain, algebra)
+                for chain in self._weight_system_chains()
+            ),
+            WeightSystem([])
+        )
+
+    def flavor_singlets_projection(self, algebra):
+        projections = {}
+
+        possibilities = itertools.product(*(
+            field.flavor_weight_systems(exponent)
+            for field, exponent in self.content.items()
+        ))
+
+        for possibility in possibilities:
+            chain = []
+            flavor_partitions = {}
+            for weight_systems, flavor in possibility:
+                chain.extend(weight_systems)
+                if flavor is not None:
+                    name, partition = flavor
+                    flavor_partitions.setdefault(name, []).append(partition)
+
+            projection = Operator._project_chain(chain, algebra)
+
+            for flavor_irreps, count in _flavor_irreps(
+                    flavor_partitions
+            ).items():
+                projections[flavor_irreps] = (
+                    projections.get(flavor_irreps, WeightSystem([]))
+                    + WeightSystem({
+                        weight: count * weight_count
+                        for weight, weight_count in projection
+                    })
+                )
+
+        return projections
+
+    def internal_singlets(self, n_derivatives, use_eom):
+        algebra = next(iter(self.content)).irrep.algebra
+        internal_singlet = Irrep.singlet(algebra[2:])
+
+        lorentz_weight_system = sum(
+            (
+                operator.internal_singlets_projection(algebra)
+                for operator in self.differentiate_fields(
+                        n_derivatives,
+                        use_eom
+                )
+            ),
+            WeightSystem([])
+        )
+
+        return IrrepCounter({
+            lorentz_irrep + internal_singlet: count
+            for lorentz_irrep, count
+            in lorentz_weight_system.decompose(algebra[:2]).items()
+        })
+
+    def flavor_singlets_with_derivatives(self, max_dimension, use_eom):
+        max_derivatives = int(max_dimension - self.dimension)
+        algebra = next(iter(self.content)).irrep.algebra
+        internal_singlet = Irrep.singlet(algebra[2:])
+
+        singlets = {}
+        for n_derivatives in range(max_derivatives + 1):
+            projections = {}
+            for operator in self.differentiate_fields(n_derivatives, use_eom):
+                for flavor_irreps, weight_system in (
+                        operator.flavor_singlets_projection(algebra).items()
+                ):
+                    projections[flavor_irreps] = (
+                        projections.get(flavor_irreps, WeightSystem([]))
+                        + weight_system
+                    )
+
+            for flavor_irreps, weight_system in projections.items():
+                singlets.setdefault(flavor_irreps, {
+                    n: IrrepCounter() for n in range(max_derivatives + 1)
+                })
+                singlets[flavor_irreps][n_derivatives] = IrrepCounter({
+                    lorentz_irrep + internal_singlet: count
+                    for lorentz_irrep, count
+                    in weight_system.decompose(algebra[:2]).items()
+                })
+
+        return singlets
+
+    def flavor_invariants(
+            self,
+            max_dimension,
+            ignore_lower_dimensions=False,
+            use_eom=True
+    ):
+        result = {}
+        singlets = self.flavor_singlets_with_derivatives(
+            max_dimension,
+            use_eom
         )
 
+        for flavor_irreps, irreps in singlets.items():
+            irreps = self._remove_total_derivatives(irreps, max_dimension)
+
+            for n_derivatives, irrep_counter in irreps.items():
+                if (
+                        ignore_lower_dimensions
+                        and n_derivatives != max_dimension - self.dimension
+                ):
+                    continue
+
+                count = sum(
+                    count for irrep, count in irrep_counter.items()
+                    if irrep.is_singlet
+                )
+                if count:
+                    result.setdefault(n_derivatives, Counter())
+                    result[n_derivatives][flavor_irreps] += count
+
+        return result
+
     def irreps_with_derivatives(
             self,
             max_dimension,
             filter_internal_singlets,
-            use_eom
+            use_eom,
+            targets=None
     ):
         max_derivatives = int(max_dimension - self.dimension)
 
+        def operator_irreps(operator):
+            if filter_internal_singlets:
+                return operator.product_irreps(
+                    operator._internal_singlet_targets()
+                )
+            else:
+                return operator.product_irreps(targets)
+
         return {
             n_derivatives:
             IrrepCounter.sum(
-                IrrepCounter({
-                    irrep: count
-                    for irrep, count in operator.irreps.items()
-                    if not filter_internal_singlets or irrep[2:].is_singlet
-                })
+                operator_irreps(operator)
                 for operator in self.differentiate_fields(
                         n_derivatives,
                         use_eom
@@ -300,36 +596,76 @@ class Operator(object):
         }
 
     def irreps_without_total_derivatives(self, max_dimension, use_eom):
-        def total_derivatives(initial_irrep, derivative_count):
-            return Operator.total_derivatives(
-                initial_irrep,
-                int(max_dimension - self.dimension - derivative_count),
-                derivative_count
-            )
+        max_derivatives = int(max_dimension - self.dimension)
+        levels = self.derivative_levels(max_dimension, use_eom)
 
-        def remove_tower(irreps_by_derivatives, tower, initial_count):
-            for n_derivatives, counter in tower.items():
-                irreps_by_derivatives[n_derivatives] -= IrrepCounter({
-                    irrep: count * initial_count
-                    for irrep, count in counter.items()
-                })
+        return {
+            n_derivatives: IrrepCounter(levels[n_derivatives])
+            for n_derivatives in range(max_derivatives + 1)
+        }
 
-        out_irreps = self.irreps_with_derivatives(max_dimension, True, use_eom)
+    def _remove_total_derivatives(self, out_irreps, max_dimension):
+        for n_derivatives in range(1, int(max_dimension - self.dimension) + 1):
+            Operator._remove_total_derivatives_at(out_irreps, n_derivatives)
 
-        for derivative_count in range(int(max_dimension - self.dimension)):
-            current_irreps = out_irreps[derivative_count].items()
+        return out_irreps
+
+    @staticmethod
+    def _remove_total_derivatives_at(irreps_by_derivatives, n_derivatives):
+        for derivative_count in range(n_derivatives):
+            current_irreps = irreps_by_derivatives[derivative_count].items()
 
             for initial_irrep, initial_count in current_irreps:
-                tower = total_derivatives(initial_irrep, derivative_count)
-                remove_tower(out_irreps, tower, initial_count)
+                tower = Operator._total_derivative_irreps(
+                    initial_irrep,
+                    n_derivatives - derivative_count
+                )
+                irreps_by_derivatives[n_derivatives] -= IrrepCounter({
+                    irrep: count * initial_count
+                    for irrep, count in tower.items()
+                })
 
-        return out_irreps
+    def derivative_levels(self, max_dimension, use_eom, levels=None):
+        max_derivatives = int(max_dimension - self.dimension)
+        signature, conjugated = self._oriented_signature()
+        key = (signature, use_eom)
+        cached_levels = _levels_cache.get(key, [])
+
+        if levels is None:
+            levels = cached_levels
+            if conjugated:
+                levels = _conjugate_levels(levels)
+
+        levels = list(levels)
+        for n_derivatives in range(len(levels), max_derivatives + 1):
+            levels.append(self.internal_singlets(n_derivatives, use_eom))
+            Operator._remove_total_derivatives_at(levels, n_derivatives)
+
+        if len(levels) > len(cached_levels):
+            _levels_cache.set(
+                key,
+                _conjugate_levels(levels) if conjugated else levels
+            )
+
+        return levels
 
     def invariants(
             self,
             max_dimension,
             ignore_lower_dimensions=False,
             use_eom=True
+    ):
+        return self.level_invariants(
+            self.derivative_levels(max_dimension, use_eom),
+            max_dimension,
+            ignore_lower_dimensions
+        )
+
+    def level_invariants(
+            self,
+            levels,
+            max_dimension,
+            ignore_lower_dimensions=False
     ):
         def correct_dimension(number_of_derivatives):
             return (
@@ -343,22 +679,92 @@ class Operator(object):
                 if irrep.is_singlet
             )
 
-        irreps = self.irreps_without_total_derivatives(max_dimension, use_eom)
+        max_derivatives = int(max_dimension - self.dimension)
 
         return {
             number_of_derivatives: sum_singlets(irrep_counter)
-            for number_of_derivatives, irrep_counter in irreps.items()
+            for number_of_derivatives, irrep_counter in enumerate(
+                    levels[:max_derivatives + 1]
+            )
             if correct_dimension(number_of_derivatives)
             if sum_singlets(irrep_counter)
         }
 
-    def covariants(
+    @staticmethod
+    def momentum_factor(algebra, max_derivatives):
+        momentum = vector + Irrep.singlet(algebra[2:])
+
+        return GradedWeightSystem(
+            (
+                WeightSystem({
+                    weight: (-1)**times * count
+                    for weight, count in momentum.power_weight_system(
+                            times,
+                            Statistics.FERMION
+                    )
+                })
+                for times in range(max_derivatives + 1)
+            ),
+            max_derivatives
+        )
+
+    def hilbert_series(
             self,
             max_dimension,
             ignore_lower_dimensions=False,
             use_eom=True
     ):
-        irreps = self.irreps_with_derivatives(max_dimension, False, use_eom)
+        max_derivatives = int(max_dimension - self.dimension)
+        algebra = next(iter(self.content)).irrep.algebra
+
+        factors = [
+            field.graded_power(exponent, max_derivatives, use_eom)
+            for field, exponent in self.content.items()
+        ]
+        factors.append(Operator.momentum_factor(algebra, max_derivatives))
+        factors.sort(key=len)
+
+        first_half = functools.reduce(mul, factors[0::2])
+        second_half = functools.reduce(mul, factors[1::2])
+        counts = first_half.singlet_multiplicities(second_half, algebra)
+
+        if self.dimension <= _MAX_RENORMALIZABLE_DIMENSION:
+            renormalizable_invariants = self.invariants(
+                min(max_dimension, _MAX_RENORMALIZABLE_DIMENSION),
+                use_eom=use_eom
+            )
+            for number_of_derivatives in range(len(counts)):
+                if (
+                        self.dimension + number_of_derivatives
+                        <= _MAX_RENORMALIZABLE_DIMENSION
+                ):
+                    counts[number_of_derivatives] = (
+                        renormalizable_invariants.get(number_of_derivatives, 0)
+                    )
+
+        return {
+            number_of_derivatives: count
+            for number_of_derivatives, count in enumerate(counts)
+            if (
+                not ignore_lower_dimensions
+                or number_of_derivatives == max_dimension - self.dimension
+            )
+            if count
+        }
+
+    def covariants(
+            self,
+            max_dimension,
+            ignore_lower_dimensions=False,
+            use_eom=True,
+            targets=None
+    ):
+        irreps = self.irreps_with_derivatives(
+            max_dimension,
+            False,
+            use_eom,
+            targets
+        )
         max_derivatives = max_dimension - self.dimension
 
         return {
@@ -437,6 +843,115 @@ class EFT(object):
                 for count in counter.values()
             )
 
+    class FlavorInvariants(object):
+        def __init__(self, invariants):
+            self.invariants = invariants
+
+        def __eq__(self, other):
+            return self.invariants == other.invariants
+
+        @staticmethod
+        def _dimension_polynomial(flavor_irreps):
+            return functools.reduce(
+                _multiply_polynomials,
+                (
+                    schur_dimension_polynomial(partition)
+                    for _, partition in flavor_irreps
+                ),
+                [Fraction(1)]
+            )
+
+        @staticmethod
+        def _show_polynomial(coefficients):
+            def term_str(power, coefficient):
+                variable = {0: "", 1: "n"}.get(power, "n^" + str(power))
+                if coefficient == 1 and variable:
+                    return variable
+                else:
+                    return "{}{}".format(coefficient, variable)
+
+            terms = [
+                term_str(power, coefficient)
+                for power, coefficient in reversed(list(
+                        enumerate(coefficients)
+                ))
+                if coefficient
+            ]
+
+            return " + ".join(terms).replace("+ -", "- ") or "0"
+
+        @staticmethod
+        def _counter_polynomial(counter):
+            return functools.reduce(
+                _add_polynomials,
+                (
+                    [
+                        count * coefficient
+                        for coefficient in
+                        EFT.FlavorInvariants._dimension_polynomial(irreps)
+                    ]
+                    for irreps, count in counter.items()
+                ),
+                []
+            )
+
+        def polynomials(self):
+            return {
+                operator: {
+                    n_derivatives:
+                    EFT.FlavorInvariants._counter_polynomial(counter)
+                    for n_derivatives, counter in current_invariants.items()
+                }
+                for operator, current_invariants in self.invariants.items()
+            }
+
+        def evaluate(self, number_of_flavors):
+            result = {}
+            for operator, current_invariants in self.invariants.items():
+                counts = {
+                    n_derivatives: sum(
+                        count * functools.reduce(
+                            mul,
+                            (
+                                schur_dimension(partition, number_of_flavors)
+                                for _, partition in flavor_irreps
+                            ),
+                            1
+                        )
+                        for flavor_irreps, count in counter.items()
+                    )
+                    for n_derivatives, counter in current_invariants.items()
+                }
+                result[operator] = {
+                    n_derivatives: count
+                    for n_derivatives, count in counts.items()
+                    if count
+                }
+
+            return EFT.Invariants(result)
+
+        def count(self):
+            return functools.reduce(
+                _add_polynomials,
+                (
+                    polynomial
+                    for counter in self.polynomials().values()
+                    for polynomial in counter.values()
+                ),
+                []
+            )
+
+        def __str__(self):
+            return ("\n").join(
+                EFT.Invariants._show_item(
+                    EFT.FlavorInvariants._show_polynomial(polynomial),
+                    operator,
+                    n_derivatives
+                )
+                for operator, polynomials in self.polynomials().items()
+                for n_derivatives, polynomial in polynomials.items()
+            )
+
     class Covariants(object):
         def __init__(self, covariants):
             self.covariants = covariants
@@ -510,15 +1025,264 @@ class EFT(object):
             )
         )
 
-    def operators(self, max_dimension):
-        return map(Operator, EFT._combinations(self.fields, max_dimension))
+    @staticmethod
+    def _integer_charges(fields):
+        number_of_charges = max(
+            (len(field.charges) for field in fields),
+            default=0
+        )
+        charges = [
+            [
+                Fraction(field.charges[index]).limit_denominator()
+                if index < len(field.charges) else Fraction(0)
+                for index in range(number_of_charges)
+            ]
+            for field in fields
+        ]
+
+        scales = [
+            functools.reduce(
+                _lcm,
+                (field_charges[index].denominator
+                 for field_charges in charges),
+                1
+            )
+            for index in range(number_of_charges)
+        ]
+
+        return [
+            tuple(
+                int(charge * scale)
+                for charge, scale in zip(field_charges, scales)
+            )
+            for field_charges in charges
+        ]
+
+    @staticmethod
+    def _neutral_combinations(fields, max_dimension):
+        charges = EFT._integer_charges(fields)
+        number_of_charges = len(charges[0]) if charges else 0
+
+        divisors = [(0,) * number_of_charges]
+        upper_rates = [(Fraction(0),) * number_of_charges]
+        lower_rates = [(Fraction(0),) * number_of_charges]
+        for field, field_charges in zip(reversed(fields), reversed(charges)):
+            rates = [
+                Fraction(charge) / field.dimension
+                for charge in field_charges
+            ]
+            divisors.append(tuple(map(math.gcd, divisors[-1], field_charges)))
+            upper_rates.append(tuple(map(max, upper_rates[-1], rates)))
+            lower_rates.append(tuple(map(min, lower_rates[-1], rates)))
+        divisors.reverse()
+        upper_rates.reverse()
+        lower_rates.reverse()
+
+        def reachable(index, total_charges, max_dimension):
+            for charge, divisor, upper_rate, lower_rate in zip(
+                    total_charges,
+                    divisors[index],
+                    upper_rates[index],
+                    lower_rates[index]
+            ):
+                if divisor == 0:
+                    if charge != 0:
+                        return False
+                elif (
+                        charge % divisor != 0
+                        or -charge > upper_rate * max_dimension
+                        or -charge < lower_rate * max_dimension
+                ):
+                    return False
+
+            return True
+
+        def combinations(index, total_charges, max_dimension):
+            if index == len(fields):
+                yield []
+                return
+
+            field = fields[index]
+            field_charges = charges[index]
+            max_exponent = math.floor(max_dimension / field.dimension)
+
+            for exponent in range(max_exponent + 1):
+                remaining_dimension = (
+                    max_dimension - exponent * field.dimension
+                )
+                new_charges = tuple(
+                    total + exponent * charge
+                    for total, charge in zip(total_charges, field_charges)
+                )
+
+                if not reachable(index + 1, new_charges, remaining_dimension):
+                    continue
+
+                for combination in combinations(
+                        index + 1,
+                        new_charges,
+                        remaining_dimension
+                ):
+                    if exponent:
+                        combination.append((field, exponent))
+                    yield combination
+
+        if not reachable(0, (0,) * number_of_charges, max_dimension):
+            return
+
+        for combination in combinations(
+                0,
+                (0,) * number_of_charges,
+                max_dimension
+        ):
+            yield Counter(dict(reversed(combination)))
+
+    def operators(self, max_dimension, neutral=False):
+        if neutral:
+            combinations = EFT._neutral_combinations(
+                self.fields,
+                max_dimension
+            )
+        else:
+            combinations = EFT._combinations(self.fields, max_dimension)
+
+        return map(Operator, combinations)
+
+    def _fingerprint(self):
+        return [str(self.algebra)] + [
+            [
+                field.name,
+                list(field.irrep.highest_weight),
+                field.statistics.name,
+                field.number_of_flavors,
+                list(map(str, field.charges)),
+                str(field.dimension),
+                field.number_of_derivatives,
+                field._force_use_eom
+            ]
+            for field in self.fields
+        ]
+
+    def _warm_caches(self, max_dimension):
+        for field in self.fields:
+            max_exponent = math.floor(max_dimension / field.dimension)
+            for exponent in range(max_exponent + 1):
+                field.irrep.power_weight_system(exponent, field.statistics)
+
+    def _map(self, function, operators, max_dimension, workers, executor):
+        if executor is not None:
+            return executor.map(function, operators)
+
+        if workers == 1:
+            return map(function, operators)
+
+        self._warm_caches(max_dimension)
+        return _process_pool_map(function, operators, workers)
+
+    def _stream(
+            self,
+            operators,
+            function,
+            prepare,
+            finish,
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            settings,
+            encode,
+            decode
+    ):
+        completed = {}
+        if checkpoint is not None:
+            settings = [self._fingerprint()] + list(settings)
+            checkpoint = Checkpoint(checkpoint)
+            completed = checkpoint.load(settings)
+
+        operators, dispatched_operators = itertools.tee(operators)
+        results = self._map(
+            function,
+            (
+                prepare(operator) for operator in dispatched_operators
+                if str(operator) not in completed
+            ),
+            max_dimension,
+            workers,
+            executor
+        )
+
+        for operator in operators:
+            key = str(operator)
+            if key in completed:
+                yield operator, decode(completed[key])
+                continue
+
+            result = finish(operator, next(results))
+            if checkpoint is not None:
+                checkpoint.write(settings, key, encode(result))
+
+            yield operator, result
+
+    def iter_invariants(
+            self,
+            max_dimension,
+            ignore_lower_dimension=False,
+            use_eom=True,
+            workers=1,
+            executor=None,
+            checkpoint=None,
+            operators=None
+    ):
+        if operators is None:
+            operators = (
+                operator
+                for operator in self.operators(max_dimension, neutral=True)
+                if operator.content
+            )
+
+        cached_levels = self.cached_results.setdefault(
+            ('levels', use_eom),
+            {}
+        )
+
+        def finish(operator, levels):
+            cached_levels[operator] = levels
+            return operator.level_invariants(
+                levels,
+                max_dimension,
+                ignore_lower_dimensions=ignore_lower_dimension
+            )
+
+        def prepare(operator):
+            return (operator, cached_levels.get(operator))
+
+        return self._stream(
+            operators,
+            functools.partial(
+                _operator_levels,
+                max_dimension=max_dimension,
+                use_eom=use_eom
+            ),
+            prepare,
+            finish,
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            ('invariants', max_dimension, ignore_lower_dimension, use_eom),
+            _encode_invariants,
+            _decode_invariants
+        )
 
     def invariants(
             self,
             max_dimension,
             verbose=False,
             ignore_lower_dimension=False,
-            use_eom=True
+            use_eom=True,
+            workers=1,
+            executor=None,
+            checkpoint=None
     ):
         result = {}
 
@@ -532,28 +1296,36 @@ class EFT(object):
         )
 
         operators_printer.start()
-        operators = self.operators(max_dimension)
+        operators = (
+            operator
+            for operator in self.operators(max_dimension, neutral=True)
+            if operator.content
+        )
         total = None
-        if verbose:
+        if verbose or workers != 1 or executor is not None:
             operators = list(operators)
             total = len(operators)
         operators_printer.end()
 
         invariants_printer.start()
-        for progress, operator in enumerate(operators):
-            invariants_printer.update(progress=progress, total=total)
-
-            if operator.content and operator.is_neutral:
-                result[operator] = operator.invariants(
+        for progress, (operator, invariants) in enumerate(
+                self.iter_invariants(
                     max_dimension,
-                    ignore_lower_dimension,
-                    use_eom
+                    ignore_lower_dimension=ignore_lower_dimension,
+                    use_eom=use_eom,
+                    workers=workers,
+                    executor=executor,
+                    checkpoint=checkpoint,
+                    operators=operators
                 )
+        ):
+            invariants_printer.update(progress=progress, total=total)
+            result[operator] = invariants
         invariants_printer.end()
 
         return EFT.Invariants(result)
 
-    def covariants(
+    def flavor_invariants(
             self,
             max_dimension,
             verbose=False,
@@ -562,6 +1334,150 @@ class EFT(object):
     ):
         result = {}
 
+        invariants_printer = ProgressPrinter(
+            "Computing flavor invariants...", "done.", "({progress}/{total})",
+            printing_function=print if verbose else None
+        )
+
+        operators = [
+            operator
+            for operator in self.operators(max_dimension, neutral=True)
+            if operator.content
+        ]
+
+        invariants_printer.start()
+        for progress, operator in enumerate(operators):
+            invariants_printer.update(progress=progress, total=len(operators))
+            result[operator] = operator.flavor_invariants(
+                max_dimension,
+                ignore_lower_dimensions=ignore_lower_dimension,
+                use_eom=use_eom
+            )
+        invariants_printer.end()
+
+        return EFT.FlavorInvariants(result)
+
+    def hilbert_series(
+            self,
+            max_dimension,
+            verbose=False,
+            ignore_lower_dimension=False,
+            use_eom=True,
+            workers=1,
+            executor=None,
+            checkpoint=None
+    ):
+        result = {}
+
+        series_printer = ProgressPrinter(
+            "Computing Hilbert series...", "done.", "({progress}/{total})",
+            printing_function=print if verbose else None
+        )
+
+        operators = [
+            operator
+            for operator in self.operators(max_dimension, neutral=True)
+            if operator.content
+        ]
+
+        operator_series = self._stream(
+            operators,
+            functools.partial(
+                _operator_hilbert_series,
+                max_dimension=max_dimension,
+                ignore_lower_dimensions=ignore_lower_dimension,
+                use_eom=use_eom
+            ),
+            lambda operator: operator,
+            lambda operator, series: series,
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            (
+                'hilbert_series',
+                max_dimension,
+                ignore_lower_dimension,
+                use_eom
+            ),
+            _encode_invariants,
+            _decode_invariants
+        )
+
+        series_printer.start()
+        for progress, (operator, series) in enumerate(operator_series):
+            series_printer.update(progress=progress, total=len(operators))
+            result[operator] = series
+        series_printer.end()
+
+        return EFT.Invariants(result)
+
+    def iter_covariants(
+            self,
+            max_dimension,
+            ignore_lower_dimension=False,
+            use_eom=True,
+            workers=1,
+            executor=None,
+            checkpoint=None,
+            operators=None,
+            targets=None
+    ):
+        if operators is None:
+            operators = (
+                operator for operator in self.operators(max_dimension)
+                if operator.content
+            )
+
+        encoded_targets = None
+        if targets is not None:
+            targets = list(targets)
+            encoded_targets = sorted(
+                list(target.highest_weight) for target in targets
+            )
+
+        def decode(encoded_covariants):
+            return _decode_covariants(encoded_covariants, self.algebra)
+
+        return self._stream(
+            operators,
+            functools.partial(
+                _operator_covariants,
+                max_dimension=max_dimension,
+                ignore_lower_dimensions=ignore_lower_dimension,
+                use_eom=use_eom,
+                targets=targets
+            ),
+            lambda operator: operator,
+            lambda operator, covariants: covariants,
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            (
+                'covariants',
+                max_dimension,
+                ignore_lower_dimension,
+                use_eom,
+                encoded_targets
+            ),
+            _encode_covariants,
+            decode
+        )
+
+    def covariants(
+            self,
+            max_dimension,
+            verbose=False,
+            ignore_lower_dimension=False,
+            use_eom=True,
+            workers=1,
+            executor=None,
+            checkpoint=None,
+            targets=None
+    ):
+        result = {}
+
         operators_printer = ProgressPrinter(
             "Computing field content combinations...", "done.",
             printing_function=print if verbose else None
@@ -573,36 +1489,161 @@ class EFT(object):
         )
 
         operators_printer.start()
-        operators = list(self.operators(max_dimension))
+        operators = [
+            operator for operator in self.operators(max_dimension)
+            if operator.content
+        ]
         total = len(operators)
         operators_printer.end()
 
         covariants_printer.start()
-        for progress, operator in enumerate(operators):
-            covariants_printer.update(progress=progress, total=total)
-
-            if operator.content:
-                covariants = operator.covariants(
+        for progress, (operator, covariants) in enumerate(
+                self.iter_covariants(
                     max_dimension,
-                    ignore_lower_dimension,
-                    use_eom
+                    ignore_lower_dimension=ignore_lower_dimension,
+                    use_eom=use_eom,
+                    workers=workers,
+                    executor=executor,
+                    checkpoint=checkpoint,
+                    operators=operators,
+                    targets=targets
                 )
-                for number_of_derivatives, irreps in covariants.items():
-                    for irrep, count in irreps.items():
-                        irrep_with_charges = (
-                            irrep.highest_weight[:2],
-                            irrep.highest_weight[2:],
-                            tuple(operator.charges)
-                        )
-                        result.setdefault(irrep_with_charges, Counter())
-                        result[irrep_with_charges] += Counter({
-                            (operator, number_of_derivatives): count
-                        })
+        ):
+            covariants_printer.update(progress=progress, total=total)
+
+            for number_of_derivatives, irreps in covariants.items():
+                for irrep, count in irreps.items():
+                    irrep_with_charges = (
+                        irrep.highest_weight[:2],
+                        irrep.highest_weight[2:],
+                        tuple(operator.charges)
+                    )
+                    result.setdefault(irrep_with_charges, Counter())
+                    result[irrep_with_charges] += Counter({
+                        (operator, number_of_derivatives): count
+                    })
         covariants_printer.end()
 
         return EFT.Covariants(result)
 
 
+def _add_polynomials(first, second):
+    length = max(len(first), len(second))
+    first = list(first) + [0] * (length - len(first))
+    second = list(second) + [0] * (length - len(second))
+
+    return [a + b for a, b in zip(first, second)]
+
+
+def _multiply_polynomials(first, second):
+    product = [0] * (len(first) + len(second) - 1)
+    for i, first_coefficient in enumerate(first):
+        for j, second_coefficient in enumerate(second):
+            product[i + j] += first_coefficient * second_coefficient
+
+    return product
+
+
+def _flavor_irreps(flavor_partitions):
+    irreps_by_name = []
+    for name, name_partitions in sorted(flavor_partitions.items()):
+        size = sum(map(sum, name_partitions))
+        irreps = Counter({name_partitions[0]: 1})
+        for partition in name_partitions[1:]:
+            product = Counter()
+            for irrep, count in irreps.items():
+                for inner_irrep, inner_count in littlewood_richardson(
+                        irrep, partition, size
+                ).items():
+                    product[inner_irrep] += count * inner_count
+            irreps = product
+
+        irreps_by_name.append([
+            ((name, irrep), count) for irrep, count in irreps.items()
+        ])
+
+    result = Counter()
+    for combination in itertools.product(*irreps_by_name):
+        result[tuple(irrep for irrep, _ in combination)] += functools.reduce(
+            mul, (count for _, count in combination), 1
+        )
+
+    return result
+
+
+def _conjugate_levels(levels):
+    return [
+        IrrepCounter({
+            Irrep(
+                irrep.algebra,
+                Weight(reversed(irrep.highest_weight[:2])).concat(
+                    irrep.highest_weight[2:]
+                )
+            ): count
+            for irrep, count in level.items()
+        })
+        for level in levels
+    ]
+
+
+def _encode_invariants(invariants):
+    return sorted(invariants.items())
+
+
+def _decode_invariants(encoded_invariants):
+    return {
+        number_of_derivatives: count
+        for number_of_derivatives, count in encoded_invariants
+    }
+
+
+def _encode_covariants(covariants):
+    return [
+        [
+            number_of_derivatives,
+            [
+                [list(irrep.highest_weight), count]
+                for irrep, count in irreps.items()
+            ]
+        ]
+        for number_of_derivatives, irreps in sorted(covariants.items())
+    ]
+
+
+def _decode_covariants(encoded_covariants, algebra):
+    return {
+        number_of_derivatives: IrrepCounter({
+            Irrep(algebra, Weight(components)): count
+            for components, count in irreps
+        })
+        for number_of_derivatives, irreps in encoded_covariants
+    }
+
+
+def _operator_levels(operator_levels, max_dimension, use_eom):
+    operator, levels = operator_levels
+    return operator.derivative_levels(max_dimension, use_eom, levels)
+
+
+def _operator_hilbert_series(operator, **kwargs):
+    return operator.hilbert_series(**kwargs)
+
+
+def _operator_covariants(operator, **kwargs):
+    return operator.covariants(**kwargs)
+
+
+def _process_pool_map(function, operators, workers):
+    operators = list(operators)
+    if workers is None:
+        workers = os.cpu_count()
+    chunksize = max(1, len(operators) // (4 * workers))
+
+    release_persistent_cache()
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        yield from executor.map(function, operators, chunksize=chunksize)
+
+
 class ProgressPrinter(object):
     def __init__(
             self,
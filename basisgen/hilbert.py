@@ -0,0 +1,132 @@
+from basisgen.representations import WeightSystem
+from basisgen.statistics import Statistics
+from basisgen.weights import Weight
+
+import collections
+
+
+def _sum_weight_systems(weight_systems):
+    weights = collections.Counter()
+    for weight_system in weight_systems:
+        weights.update(weight_system.weights)
+
+    return WeightSystem({
+        weight: count for weight, count in weights.items() if count
+    })
+
+
+class GradedWeightSystem(object):
+    def __init__(self, grades, max_grade):
+        self.max_grade = max_grade
+        self.grades = list(grades)[:max_grade + 1]
+        self.grades.extend(
+            WeightSystem([])
+            for _ in range(max_grade + 1 - len(self.grades))
+        )
+
+    @staticmethod
+    def unit(length, max_grade):
+        return GradedWeightSystem(
+            [WeightSystem([Weight([0] * length)])],
+            max_grade
+        )
+
+    def __len__(self):
+        return sum(len(grade.weights) for grade in self.grades)
+
+    def truncate(self, max_grade):
+        return GradedWeightSystem(self.grades, max_grade)
+
+    def __mul__(self, other):
+        max_grade = min(self.max_grade, other.max_grade)
+
+        return GradedWeightSystem(
+            (
+                _sum_weight_systems(
+                    self.grades[first_grade]
+                    * other.grades[grade - first_grade]
+                    for first_grade in range(grade + 1)
+                )
+                for grade in range(max_grade + 1)
+            ),
+            max_grade
+        )
+
+    def scale(self, factor):
+        return GradedWeightSystem(
+            (
+                WeightSystem({
+                    weight: factor * count for weight, count in grade
+                })
+                for grade in self.grades
+            ),
+            self.max_grade
+        )
+
+    def adams_operation(self, k):
+        grades = [WeightSystem([]) for _ in range(self.max_grade + 1)]
+        for grade in range(self.max_grade // k + 1):
+            grades[k * grade] = self.grades[grade].adams_operation(k)
+
+        return GradedWeightSystem(grades, self.max_grade)
+
+    def power(self, exponent, statistics):
+        sign = {
+            Statistics.BOSON: 1,
+            Statistics.FERMION: -1
+        }[statistics]
+
+        length = next(
+            len(weight)
+            for grade in self.grades
+            for weight in grade.weights
+        )
+        powers = [GradedWeightSystem.unit(length, self.max_grade)]
+
+        for current_exponent in range(1, exponent + 1):
+            grades = []
+            terms = [
+                (
+                    sign**(k - 1),
+                    self.adams_operation(k) * powers[current_exponent - k]
+                )
+                for k in range(1, current_exponent + 1)
+            ]
+
+            for grade in range(self.max_grade + 1):
+                newton_sum = collections.Counter()
+                for term_sign, term in terms:
+                    for weight, count in term.grades[grade]:
+                        newton_sum[weight] += term_sign * count
+
+                grades.append(WeightSystem({
+                    weight: count // current_exponent
+                    for weight, count in newton_sum.items()
+                    if count
+                }))
+
+            powers.append(GradedWeightSystem(grades, self.max_grade))
+
+        return powers[exponent]
+
+    def singlet_multiplicities(self, other, algebra):
+        max_grade = min(self.max_grade, other.max_grade)
+        first_irreps = [
+            grade.irrep_multiplicities(algebra)
+            for grade in self.grades[:max_grade + 1]
+        ]
+        second_irreps = [
+            grade.irrep_multiplicities(algebra)
+            for grade in other.grades[:max_grade + 1]
+        ]
+
+        return [
+            sum(
+                count * second_irreps[grade - first_grade].get(
+                    irrep.conjugate, 0
+                )
+                for first_grade in range(grade + 1)
+                for irrep, count in first_irreps[first_grade].items()
+            )
+            for grade in range(max_grade + 1)
+        ]
@@ -1,4 +1,4 @@
-import functools
+from basisgen.cache import cached
 
 
 def partitions_generator(n, k):
@@ -10,6 +10,6 @@ def partitions_generator(n, k):
                 yield previous_partition + (m,)
 
 
-@functools.lru_cache(maxsize=None)
+@cached('partitions.partitions')
 def partitions(n, k):
     return list(partitions_generator(n, k))
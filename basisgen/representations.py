@@ -1,16 +1,102 @@
-from basisgen.algebras import SemisimpleAlgebra
-from basisgen.weights import Weight
+from basisgen.algebras import Series, SemisimpleAlgebra
+from basisgen.weights import Weight, WeightBox
 from basisgen.statistics import Statistics
-from basisgen.containers import MultivaluedMap, OrderedCounter
+from basisgen.containers import OrderedCounter
+from basisgen.cache import cached, persistent, DEFAULT_WEIGHTS_MAXSIZE
+from basisgen.young import (
+    partition_from_dynkin, dynkin_from_partition, littlewood_richardson,
+    integer_partitions, symmetric_group_character, centralizer_order
+)
 
 import collections
+import enum
 import itertools
 import functools
+import heapq
+import math
+import operator
+import weakref
+
+
+def _encode_weight_system(weight_system):
+    return [(tuple(weight), count) for weight, count in weight_system]
+
+
+def _decode_weight_system(weights, *args, **kwargs):
+    return WeightSystem({Weight(weight): count for weight, count in weights})
+
+
+def _encode_irreps(irreps):
+    return [
+        (tuple(irrep.highest_weight), count)
+        for irrep, count in irreps.items()
+    ]
+
+
+def _decode_irreps(irreps, irrep, *args, **kwargs):
+    return IrrepCounter({
+        Irrep(irrep.algebra, Weight(highest_weight)): count
+        for highest_weight, count in irreps
+    })
+
+
+_PRODUCT_CACHE_MAXSIZE = 16384
+
+
+def _weight_system_cost(weight_system):
+    return len(weight_system.weights)
+
+
+def _weights_by_level_cost(weights_by_level):
+    return sum(map(len, weights_by_level.values()))
+
+
+def _is_su2_algebra(algebra):
+    return (
+        not isinstance(algebra, SemisimpleAlgebra)
+        and algebra.series is Series.A
+        and algebra.rank == 1
+    )
+
+
+def _gaussian_binomial(rows, columns):
+    coefficients = [1]
+    for i in range(1, rows + 1):
+        shift = columns + i
+        coefficients.extend([0] * columns)
+        for j in reversed(range(shift, len(coefficients))):
+            coefficients[j] -= coefficients[j - shift]
+        for j in range(i, len(coefficients)):
+            coefficients[j] += coefficients[j - i]
+        del coefficients[rows * columns + 1:]
+
+    return coefficients
+
+
+def _su2_box_irreps(algebra, rows, columns):
+    coefficients = _gaussian_binomial(rows, columns)
+    top = rows * columns
+
+    return IrrepCounter({
+        Irrep(algebra, Weight([top - 2 * s])):
+        coefficients[s] - (coefficients[s - 1] if s else 0)
+        for s in range(top // 2 + 1)
+        if coefficients[s] != (coefficients[s - 1] if s else 0)
+    })
+
+
+class TensorProductEngine(enum.Enum):
+    AUTO = 1
+    WEIGHTS = 2
+    LITTLEWOOD_RICHARDSON = 3
+    BRAUER_KLIMYK = 4
 
 
 class WeightSystem(object):
     def __init__(self, weights):
         self.weights = collections.Counter(weights)
+        self._sorted_algebra = None
+        self._sorted_weights = None
 
     def __str__(self):
         return str(self.weights.elements())
@@ -24,13 +110,82 @@ class WeightSystem(object):
         return WeightSystem(self.weights + other.weights)
 
     def __mul__(self, other):
-        return WeightSystem(
-            first_weight + second_weight
-            for first_weight in self.weights.elements()
-            for second_weight in other.weights.elements()
+        if not self.weights or not other.weights:
+            return WeightSystem([])
+
+        first_lower, first_upper = WeightBox.bounds(self.weights)
+        second_lower, second_upper = WeightBox.bounds(other.weights)
+        box = WeightBox(
+            first_lower + second_lower,
+            first_upper + second_upper
         )
 
-    @functools.lru_cache(maxsize=None)
+        first_items = [
+            (box.offset(weight, first_lower), count)
+            for weight, count in self
+        ]
+        second_items = [
+            (box.offset(weight, second_lower), count)
+            for weight, count in other
+        ]
+
+        if box.volume <= len(first_items) * len(second_items):
+            product = [0] * box.volume
+            nonzero_indices = range(box.volume)
+        else:
+            product = collections.defaultdict(int)
+            nonzero_indices = product
+
+        for first_index, first_count in first_items:
+            for second_index, second_count in second_items:
+                product[first_index + second_index] += (
+                    first_count * second_count
+                )
+
+        return WeightSystem({
+            box.weight(index): product[index]
+            for index in nonzero_indices
+            if product[index]
+        })
+
+    def adams_operation(self, k):
+        return WeightSystem({k * weight: count for weight, count in self})
+
+    def schur_functor(self, partition):
+        n = sum(partition)
+        if n == 0:
+            return WeightSystem([Weight([0] * len(next(iter(self.weights))))])
+
+        n_factorial = math.factorial(n)
+        weights = collections.Counter()
+
+        for cycle_type in integer_partitions(n):
+            coefficient = symmetric_group_character(partition, cycle_type) * (
+                n_factorial // centralizer_order(cycle_type)
+            )
+            if not coefficient:
+                continue
+
+            term = functools.reduce(
+                operator.mul,
+                map(self.adams_operation, cycle_type)
+            )
+            for weight, count in term:
+                weights[weight] += coefficient * count
+
+        return WeightSystem({
+            weight: count // n_factorial
+            for weight, count in weights.items()
+            if count
+        })
+
+    def outer(self, other):
+        return WeightSystem({
+            first_weight.concat(second_weight): first_count * second_count
+            for first_weight, first_count in self
+            for second_weight, second_count in other
+        })
+
     def highest_weight(self, algebra):
         return max(self.weights, key=algebra.height)
 
@@ -38,28 +193,102 @@ class WeightSystem(object):
         def height_of_first(pair):
             return algebra.height(pair[0])
 
+        if algebra is self._sorted_algebra:
+            return OrderedCounter(collections.OrderedDict(
+                (weight, self.weights[weight])
+                for weight in self._sorted_weights
+            ))
+
         return OrderedCounter.sort(self, height_of_first)
 
-    @functools.lru_cache(maxsize=None)
+    def sorted_by_height(self, algebra):
+        weight_system = WeightSystem(self.weights)
+        weight_system._sorted_algebra = algebra
+        weight_system._sorted_weights = tuple(self.sorted_weights(algebra))
+
+        return weight_system
+
     def decompose(self, algebra):
-        remaining_weights = self.sorted_weights(algebra)
+        return self.irrep_multiplicities(algebra)
+
+    def irrep_multiplicities(self, algebra):
+        remaining_multiplicities = {
+            weight: count
+            for weight, count in self.weights.items()
+            if count and all(component >= 0 for component in weight)
+        }
+        pending_weights = [
+            (-algebra.height(weight), weight)
+            for weight in remaining_multiplicities
+        ]
+        heapq.heapify(pending_weights)
         irreps = IrrepCounter()
 
-        while remaining_weights:
-            highest_weight, multiplicity = remaining_weights.popitem()
+        while pending_weights:
+            _, highest_weight = heapq.heappop(pending_weights)
+            multiplicity = remaining_multiplicities.pop(highest_weight)
+            if not multiplicity:
+                continue
 
             current_irrep = Irrep(algebra, highest_weight)
-            irreps[current_irrep] += multiplicity
+            irreps[current_irrep] = multiplicity
 
-            current_rep = current_irrep.weight_system
-            remaining_weights[highest_weight] = multiplicity
-            remaining_weights -= collections.Counter({
-                weight: count * multiplicity
-                for weight, count in current_rep
-            })
+            for weight, count in current_irrep.dominant_multiplicities.items():
+                if weight == highest_weight:
+                    continue
+
+                if weight not in remaining_multiplicities:
+                    remaining_multiplicities[weight] = 0
+                    heapq.heappush(
+                        pending_weights,
+                        (-algebra.height(weight), weight)
+                    )
+
+                remaining_multiplicities[weight] -= count * multiplicity
 
         return irreps
 
+    def singlet_projection(self, algebra, start):
+        subalgebra = algebra[start:]
+        projection = collections.Counter()
+
+        for weight, count in self:
+            sign = subalgebra.singlet_sign(weight[start:])
+            if sign:
+                projection[weight[:start]] += sign * count
+
+        return WeightSystem(+projection)
+
+    def product_singlet_projection(self, other, algebra, start):
+        subalgebra = algebra[start:]
+        if not subalgebra.has_tabulated_weyl_denominator:
+            return (self * other).singlet_projection(algebra, start)
+
+        def by_tail(weight_system):
+            grouped = collections.defaultdict(list)
+            for weight, count in weight_system:
+                grouped[weight[start:]].append((weight[:start], count))
+            return grouped
+
+        other_by_tail = by_tail(other)
+        projection = collections.Counter()
+
+        for first_tail, first_weights in by_tail(self).items():
+            second_heads = collections.Counter()
+
+            for tail, sign in subalgebra.weyl_denominator.items():
+                second_weights = other_by_tail.get(tail - first_tail, ())
+                for second_head, second_count in second_weights:
+                    second_heads[second_head] += sign * second_count
+
+            for second_head, second_count in second_heads.items():
+                for first_head, first_count in first_weights:
+                    projection[first_head + second_head] += (
+                        first_count * second_count
+                    )
+
+        return WeightSystem(+projection)
+
 
 class Irrep(object):
     class WeightsView(object):
@@ -77,9 +306,28 @@ class Irrep(object):
 
         __repr__ = __str__
 
-    def __init__(self, algebra, highest_weight):
-        self.algebra = algebra
-        self.highest_weight = highest_weight
+    tensor_product_engine = TensorProductEngine.AUTO
+
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, algebra, highest_weight):
+        if not isinstance(highest_weight, Weight):
+            highest_weight = Weight(highest_weight)
+
+        key = (algebra, highest_weight)
+        instance = Irrep._instances.get(key)
+
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.algebra = algebra
+            instance.highest_weight = highest_weight
+            instance._hash = hash(key)
+            Irrep._instances[key] = instance
+
+        return instance
+
+    def __reduce__(self):
+        return Irrep, (self.algebra, self.highest_weight)
 
     def __str__(self):
         return "[{}]".format(
@@ -99,24 +347,24 @@ class Irrep(object):
         )
 
     def __hash__(self):
-        return hash((self.algebra, self.highest_weight))
-
-    def __eq__(self, other):
-        return (
-            self.algebra == other.algebra
-            and self.highest_weight == other.highest_weight
-        )
+        return self._hash
 
     @staticmethod
-    @functools.lru_cache(maxsize=None)
     def positive_roots(algebra):
-        all_roots = Irrep(algebra, algebra.highest_root).weights_by_level
+        return algebra.data.positive_roots
 
-        return [
-            root
-            for level in range(algebra.level_of_simple_roots + 1)
-            for root in all_roots[level]
-        ]
+    @property
+    def _is_su2(self):
+        return _is_su2_algebra(self.algebra)
+
+    @property
+    def _is_su2_bifundamental(self):
+        return (
+            isinstance(self.algebra, SemisimpleAlgebra)
+            and len(self.algebra.simple_algebras) == 2
+            and all(map(_is_su2_algebra, self.algebra.simple_algebras))
+            and self.highest_weight == Weight([1, 1])
+        )
 
     def split(self):
         return map(
@@ -127,13 +375,66 @@ class Irrep(object):
 
     @property
     def conjugate(self):
-        lowest_weight = next(iter(
-            self.weight_system.sorted_weights(self.algebra)
-        ))
+        highest_weight, _ = self.algebra.reflect_to_dominant(
+            -self.highest_weight
+        )
+
+        return Irrep(self.algebra, highest_weight)
+
+    @property
+    def dimension(self):
+        if isinstance(self.algebra, SemisimpleAlgebra):
+            return functools.reduce(
+                operator.mul,
+                (irrep.dimension for irrep in self.split()),
+                1
+            )
+
+        return self._simple_dimension()
+
+    @cached('Irrep._simple_dimension')
+    def _simple_dimension(self):
+        algebra = self.algebra
+        data = algebra.data
+        rho = data.rho
+        shifted_highest_weight = self.highest_weight + rho
 
-        return Irrep(self.algebra, -lowest_weight)
+        numerator = denominator = 1
+        for root in data.positive_roots:
+            numerator *= algebra.scaled_scalar_product(
+                shifted_highest_weight, root
+            )
+            denominator *= algebra.scaled_scalar_product(rho, root)
+
+        return numerator // denominator
+
+    @property
+    def congruence_class(self):
+        return self.algebra.congruence_class(self.highest_weight)
+
+    @property
+    def index(self):
+        if isinstance(self.algebra, SemisimpleAlgebra):
+            return [
+                irrep.index * (self.dimension // irrep.dimension)
+                for irrep in self.split()
+            ]
+
+        algebra = self.algebra
+        data = algebra.data
+        highest_weight = self.highest_weight
+        adjoint_dimension = algebra.rank + 2 * len(data.positive_roots)
+
+        return (
+            self.dimension
+            * algebra.scalar_product(
+                highest_weight,
+                highest_weight + 2 * data.rho
+            )
+            / (2 * adjoint_dimension)
+        )
 
-    @functools.lru_cache(maxsize=None)
+    @cached('Irrep._mul_semisimple_irreps', maxsize=_PRODUCT_CACHE_MAXSIZE)
     def _mul_semisimple_irreps(self, other):
         out = IrrepCounter()
 
@@ -153,8 +454,89 @@ class Irrep(object):
 
         return out
 
-    @functools.lru_cache(maxsize=None)
+    @cached('Irrep._mul_simple_irreps', maxsize=_PRODUCT_CACHE_MAXSIZE)
+    @persistent('product', _encode_irreps, _decode_irreps)
     def _mul_simple_irreps(self, other):
+        if other.is_singlet:
+            return IrrepCounter({self: 1})
+
+        if self.is_singlet:
+            return IrrepCounter({other: 1})
+
+        engine = Irrep.tensor_product_engine
+        if engine is TensorProductEngine.AUTO:
+            if self._is_su2:
+                return self._clebsch_gordan_product(other)
+            elif self.algebra.series is Series.A:
+                engine = TensorProductEngine.LITTLEWOOD_RICHARDSON
+            else:
+                engine = TensorProductEngine.BRAUER_KLIMYK
+
+        if (
+                engine is TensorProductEngine.LITTLEWOOD_RICHARDSON
+                and self.algebra.series is Series.A
+        ):
+            return self._littlewood_richardson_product(other)
+
+        if engine is TensorProductEngine.BRAUER_KLIMYK:
+            return self._brauer_klimyk_product(other)
+
+        return self._weight_system_product(other)
+
+    def _clebsch_gordan_product(self, other):
+        first, second = self.highest_weight[0], other.highest_weight[0]
+
+        return IrrepCounter({
+            Irrep(self.algebra, Weight([first + second - 2 * k])): 1
+            for k in range(min(first, second) + 1)
+        })
+
+    def _littlewood_richardson_product(self, other):
+        rank = self.algebra.rank
+        partitions = littlewood_richardson(
+            partition_from_dynkin(self.highest_weight),
+            partition_from_dynkin(other.highest_weight),
+            rank + 1
+        )
+
+        out = collections.Counter()
+        for partition, count in partitions.items():
+            highest_weight = Weight(dynkin_from_partition(partition, rank))
+            out[Irrep(self.algebra, highest_weight)] += count
+
+        return IrrepCounter(OrderedCounter.sort(
+            out.items(),
+            key=lambda pair: -self.algebra.height(pair[0].highest_weight)
+        ))
+
+    def _brauer_klimyk_product(self, other):
+        algebra = self.algebra
+        larger, smaller = sorted(
+            [self, other],
+            key=lambda irrep: -irrep.dimension
+        )
+
+        rho = algebra.data.rho
+        shifted_highest_weight = larger.highest_weight + rho
+
+        out = collections.Counter()
+        for weight, count in smaller.weight_system:
+            dominant_weight, sign = algebra.reflect_to_dominant(
+                shifted_highest_weight + weight
+            )
+            if all(dominant_weight):
+                out[dominant_weight - rho] += sign * count
+
+        return IrrepCounter(OrderedCounter.sort(
+            (
+                (Irrep(algebra, highest_weight), count)
+                for highest_weight, count in out.items()
+                if count
+            ),
+            key=lambda pair: -algebra.height(pair[0].highest_weight)
+        ))
+
+    def _weight_system_product(self, other):
         product_weight_system = self.weight_system * other.weight_system
         return product_weight_system.decompose(self.algebra)
 
@@ -178,65 +560,149 @@ class Irrep(object):
         return all(component == 0 for component in self.highest_weight)
 
     @staticmethod
-    @functools.lru_cache(maxsize=None)
+    @cached('Irrep.singlet')
     def singlet(algebra):
         return Irrep(algebra, Weight([0] * algebra.rank))
 
-    def _child_weights(self, weight, level):
-        return MultivaluedMap.from_pairs(
-            (level + k, weight - k*root)
-            for root, component in zip(self.algebra.simple_roots, weight)
-            for k in range(1, component + 1)
-        )
+    def iter_weights_by_level(self):
+        simple_roots = self.algebra.data.simple_roots
+        rank = self.algebra.rank
+
+        # Each weight carries, for every simple root, the number of steps
+        # the root string through it extends upwards
+        current_weights = {self.highest_weight: (0,) * rank}
+        level = 0
+
+        while current_weights:
+            yield level, tuple(sorted(current_weights))
+
+            previous_weights = current_weights
+            current_weights = {}
+
+            for weight, upper_lengths in previous_weights.items():
+                for index, root in enumerate(simple_roots):
+                    if weight[index] + upper_lengths[index] < 1:
+                        continue
+
+                    child_weight = weight - root
+                    if child_weight in current_weights:
+                        continue
+
+                    child_lengths = []
+                    for other_index, other_root in enumerate(simple_roots):
+                        parent_lengths = previous_weights.get(
+                            child_weight + other_root
+                        )
+                        child_lengths.append(
+                            0 if parent_lengths is None
+                            else parent_lengths[other_index] + 1
+                        )
+
+                    current_weights[child_weight] = tuple(child_lengths)
+
+            level += 1
 
     @property
+    @cached(
+        'Irrep.weights_by_level',
+        maxsize=DEFAULT_WEIGHTS_MAXSIZE,
+        cost=_weights_by_level_cost
+    )
     def weights_by_level(self):
-        current_weights = self._child_weights(self.highest_weight, 0)
-        all_weights = MultivaluedMap({0: {self.highest_weight}})
+        return dict(self.iter_weights_by_level())
+
+    @property
+    def dominant_weights(self):
+        positive_roots = self.algebra.data.positive_roots
+        dominant_weights = {self.highest_weight}
+        current_weights = [self.highest_weight]
 
         while current_weights:
             previous_weights = current_weights
-            current_weights = MultivaluedMap()
+            current_weights = []
+
+            for weight in previous_weights:
+                for root in positive_roots:
+                    lower_weight = weight - root
+                    if (
+                            lower_weight not in dominant_weights
+                            and all(component >= 0
+                                    for component in lower_weight)
+                    ):
+                        dominant_weights.add(lower_weight)
+                        current_weights.append(lower_weight)
+
+        return sorted(dominant_weights, key=self.algebra.height, reverse=True)
+
+    def _dominant_weight_multiplicity(self, weight, dominant_multiplicities):
+        def multiplicity(shifted_weight):
+            dominant_weight, _ = self.algebra.reflect_to_dominant(
+                shifted_weight
+            )
+            return dominant_multiplicities.get(dominant_weight, 0)
 
-            for level in previous_weights:
-                for weight in previous_weights[level]:
-                    current_weights.update(self._child_weights(weight, level))
+        data = self.algebra.data
+        delta = data.rho
+        numerator = 0
 
-            all_weights.update(previous_weights)
+        for alpha in data.positive_roots:
+            shifted_weight = weight + alpha
+            shifted_multiplicity = multiplicity(shifted_weight)
 
-        return all_weights
+            while shifted_multiplicity:
+                numerator += 2 * shifted_multiplicity * (
+                    self.algebra.scaled_scalar_product(shifted_weight, alpha)
+                )
+                shifted_weight = shifted_weight + alpha
+                shifted_multiplicity = multiplicity(shifted_weight)
 
-    def _weight_multiplicity(self, level, weight, previous_multiplicities):
-        if level == 0:
-            return 1
+        denominator = (
+            self.algebra.scaled_norm_squared(self.highest_weight + delta)
+            - self.algebra.scaled_norm_squared(weight + delta)
+        )
 
-        delta = self.algebra.sum_of_positive_roots
+        return numerator // denominator
 
-        numerator = 2 * sum(
-            previous_multiplicities.get(weight + k*alpha, 0)
-            * self.algebra.scalar_product(weight + k*alpha, alpha)
-            for k in range(1, level + 1)
-            for alpha in Irrep.positive_roots(self.algebra)
+    @property
+    def dominant_weights_with_multiplicities(self):
+        dominant_weights = iter(self.dominant_weights)
+        multiplicities = collections.OrderedDict(
+            [(next(dominant_weights), 1)]
         )
 
-        denominator = (
-            self.algebra.norm_squared(self.highest_weight + delta)
-            - self.algebra.norm_squared(weight + delta)
-        )
+        for weight in dominant_weights:
+            multiplicities[weight] = self._dominant_weight_multiplicity(
+                weight,
+                multiplicities
+            )
+
+        return multiplicities
+
+    @property
+    @cached('Irrep.dominant_multiplicities')
+    def dominant_multiplicities(self):
+        if not isinstance(self.algebra, SemisimpleAlgebra):
+            return dict(self.dominant_weights_with_multiplicities)
+
+        multiplicities = {Weight([]): 1}
+        for irrep in self.split():
+            multiplicities = {
+                weight.concat(inner_weight): count * inner_count
+                for weight, count in multiplicities.items()
+                for inner_weight, inner_count
+                in irrep.dominant_multiplicities.items()
+            }
 
-        return round(numerator / denominator)
+        return multiplicities
 
     @property
     def weights_with_multiplicities(self):
         multiplicities = collections.Counter()
 
-        for level, weights in self.weights_by_level.items():
-            for weight in weights:
-                multiplicities[weight] = self._weight_multiplicity(
-                    level,
-                    weight,
-                    multiplicities
-                )
+        dominant_multiplicities = self.dominant_multiplicities
+        for dominant_weight, multiplicity in dominant_multiplicities.items():
+            for weight in self.algebra.weyl_orbit(dominant_weight):
+                multiplicities[weight] = multiplicity
 
         return multiplicities
 
@@ -245,22 +711,34 @@ class Irrep(object):
         algebras = self.algebra.simple_algebras
         split_highest_weight = self.algebra.split_weight(self.highest_weight)
 
-        split_weights = (
-            Irrep(algebra, weight).weight_system.weights.elements()
+        split_weight_systems = (
+            Irrep(algebra, weight).weight_system
             for algebra, weight in zip(algebras, split_highest_weight)
         )
 
-        return WeightSystem(
-            Weight(list(itertools.chain.from_iterable(weights)))
-            for weights in itertools.product(*split_weights)
+        return functools.reduce(
+            WeightSystem.outer,
+            split_weight_systems,
+            WeightSystem([Weight([])])
         )
 
     @property
+    @cached(
+        'Irrep.weight_system',
+        maxsize=DEFAULT_WEIGHTS_MAXSIZE,
+        cost=_weight_system_cost
+    )
     def weight_system(self):
         if isinstance(self.algebra, SemisimpleAlgebra):
-            return self._semisimple_weight_system
+            weight_system = self._semisimple_weight_system
         else:
-            return WeightSystem(self.weights_with_multiplicities)
+            weight_system = self._simple_weight_system()
+
+        return weight_system.sorted_by_height(self.algebra)
+
+    @persistent('weight_system', _encode_weight_system, _decode_weight_system)
+    def _simple_weight_system(self):
+        return WeightSystem(self.weights_with_multiplicities)
 
     def weights_view(self):
         groups = itertools.groupby(
@@ -272,21 +750,80 @@ class Irrep(object):
 
         return Irrep.WeightsView([list(weights) for _, weights in groups])
 
-    @functools.lru_cache(maxsize=None)
+    @cached(
+        'Irrep.schur_weight_system',
+        maxsize=DEFAULT_WEIGHTS_MAXSIZE,
+        cost=_weight_system_cost
+    )
+    def schur_weight_system(self, partition):
+        return self.weight_system.schur_functor(partition)
+
+    @cached('Irrep.power', maxsize=_PRODUCT_CACHE_MAXSIZE)
+    @persistent('power', _encode_irreps, _decode_irreps)
     def power(self, exponent, statistics):
-        combinations_function = {
-            Statistics.BOSON: itertools.combinations_with_replacement,
-            Statistics.FERMION: itertools.combinations
-        }[statistics]
+        if self._is_su2:
+            dimension = self.highest_weight[0] + 1
+            if statistics == Statistics.BOSON:
+                return _su2_box_irreps(
+                    self.algebra,
+                    exponent,
+                    dimension - 1
+                )
+            elif exponent <= dimension:
+                return _su2_box_irreps(
+                    self.algebra,
+                    exponent,
+                    dimension - exponent
+                )
+            else:
+                return IrrepCounter()
 
-        weights = self.weight_system.weights.elements()
+        if self._is_su2_bifundamental and statistics == Statistics.BOSON:
+            return IrrepCounter({
+                Irrep(self.algebra, Weight([exponent - 2 * k] * 2)): 1
+                for k in range(exponent // 2 + 1)
+            })
 
-        power_weights = (
-            sum(combination, Irrep.singlet(self.algebra).highest_weight)
-            for combination in combinations_function(weights, exponent)
+        return self.power_weight_system(exponent, statistics).decompose(
+            self.algebra
         )
 
-        return WeightSystem(power_weights).decompose(self.algebra)
+    @cached(
+        'Irrep.power_weight_system',
+        maxsize=DEFAULT_WEIGHTS_MAXSIZE,
+        cost=_weight_system_cost
+    )
+    @persistent(
+        'power_weight_system',
+        _encode_weight_system,
+        _decode_weight_system
+    )
+    def power_weight_system(self, exponent, statistics):
+        if exponent == 0:
+            return WeightSystem([Irrep.singlet(self.algebra).highest_weight])
+
+        sign = {
+            Statistics.BOSON: 1,
+            Statistics.FERMION: -1
+        }[statistics]
+
+        weight_system = self.weight_system
+        newton_sum = collections.Counter()
+
+        for k in range(1, exponent + 1):
+            term = (
+                weight_system.adams_operation(k)
+                * self.power_weight_system(exponent - k, statistics)
+            )
+
+            for weight, count in term:
+                newton_sum[weight] += sign**(k - 1) * count
+
+        return WeightSystem({
+            weight: count // exponent
+            for weight, count in newton_sum.items()
+            if count
+        })
 
 
 class IrrepCounter(collections.Counter):
@@ -322,3 +859,74 @@ class IrrepCounter(collections.Counter):
     @staticmethod
     def sum(irrep_counters):
         return sum(irrep_counters, IrrepCounter())
+
+    @staticmethod
+    def product(factors, targets=None):
+        factors = [
+            IrrepCounter([factor]) if isinstance(factor, Irrep) else factor
+            for factor in factors
+        ]
+
+        if targets is None:
+            return functools.reduce(operator.mul, factors)
+
+        targets = list(targets)
+        if not targets or not all(factors):
+            return IrrepCounter()
+
+        algebra = targets[0].algebra
+
+        def coordinates(irrep):
+            return algebra.scaled_root_coordinates(irrep.highest_weight)
+
+        def max_coordinates(irreps):
+            return map(max, [0] * algebra.rank, *map(coordinates, irreps))
+
+        upper_bounds = [[0] * algebra.rank]
+        lower_bounds = [[0] * algebra.rank]
+        for factor in reversed(factors[1:]):
+            upper_bounds.append(list(map(
+                operator.add,
+                upper_bounds[-1],
+                max_coordinates(irrep.conjugate for irrep in factor)
+            )))
+            lower_bounds.append(list(map(
+                operator.add,
+                lower_bounds[-1],
+                max_coordinates(factor)
+            )))
+        upper_bounds.reverse()
+        lower_bounds.reverse()
+
+        targets_coordinates = list(map(coordinates, targets))
+
+        def reachable(irrep, upper_bound, lower_bound):
+            irrep_coordinates = coordinates(irrep)
+            return any(
+                all(
+                    coordinate - upper <= target <= coordinate + lower
+                    for coordinate, target, upper, lower in zip(
+                            irrep_coordinates,
+                            target_coordinates,
+                            upper_bound,
+                            lower_bound
+                    )
+                )
+                for target_coordinates in targets_coordinates
+            )
+
+        result = None
+        for factor, upper_bound, lower_bound in zip(
+                factors, upper_bounds, lower_bounds
+        ):
+            result = IrrepCounter({
+                irrep: count
+                for irrep, count in (
+                    factor if result is None else result * factor
+                ).items()
+                if reachable(irrep, upper_bound, lower_bound)
+            })
+
+        return IrrepCounter({
+            target: result[target] for target in targets if result[target]
+        })
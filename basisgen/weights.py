@@ -1,6 +1,15 @@
-class Weight(object):
-    def __init__(self, components):
-        self.components = tuple(components)
+import operator
+
+
+class Weight(tuple):
+    __slots__ = ()
+
+    def __new__(cls, components):
+        return tuple.__new__(cls, components)
+
+    @property
+    def components(self):
+        return tuple(self)
 
     def __str__(self):
         return "({})".format(
@@ -9,37 +18,60 @@ class Weight(object):
 
     __repr__ = __str__
 
-    def __hash__(self):
-        return hash(self.components)
-
-    def __eq__(self, other):
-        return self.components == other.components
-
     def __add__(self, other):
-        return Weight(x + y for x, y in zip(self, other))
+        return Weight(map(operator.add, self, other))
 
     def __neg__(self):
-        return Weight(-x for x in self)
+        return Weight(map(operator.neg, self))
 
     def __sub__(self, other):
-        return Weight(x - y for x, y in zip(self, other))
+        return Weight(map(operator.sub, self, other))
 
     def __mul__(self, other):
-        return Weight(tuple(other * x for x in self))
+        return Weight([other * x for x in self])
 
     __rmul__ = __mul__
 
-    def __iter__(self):
-        return iter(self.components)
-
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return Weight(self.components[key])
+            return Weight(tuple.__getitem__(self, key))
         else:
-            return self.components[key]
-
-    def __len__(self):
-        return len(self.components)
+            return tuple.__getitem__(self, key)
 
     def concat(self, other):
-        return Weight(self.components + other.components)
+        return Weight(tuple.__add__(self, other))
+
+
+class WeightBox(object):
+    def __init__(self, lower, upper):
+        self.lower = Weight(lower)
+        self.sizes = [high - low + 1 for low, high in zip(lower, upper)]
+
+        self.strides = []
+        self.volume = 1
+        for size in self.sizes:
+            self.strides.append(self.volume)
+            self.volume *= size
+
+    @staticmethod
+    def bounds(weights):
+        weights = list(weights)
+        return (
+            Weight(map(min, *weights)) if len(weights) > 1 else weights[0],
+            Weight(map(max, *weights)) if len(weights) > 1 else weights[0]
+        )
+
+    def offset(self, weight, lower):
+        return sum(map(
+            operator.mul,
+            map(operator.sub, weight, lower),
+            self.strides
+        ))
+
+    def weight(self, index):
+        components = []
+        for size in self.sizes:
+            index, component = divmod(index, size)
+            components.append(component)
+
+        return Weight(map(operator.add, components, self.lower))
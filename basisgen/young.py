@@ -0,0 +1,175 @@
+from basisgen.cache import cached
+
+import collections
+import math
+from fractions import Fraction
+
+
+def partition_from_dynkin(labels):
+    partition = []
+    total = 0
+    for label in reversed(labels):
+        total += label
+        partition.append(total)
+
+    return tuple(reversed(partition))
+
+
+def dynkin_from_partition(partition, rank):
+    rows = list(partition) + [0] * (rank + 1 - len(partition))
+    return tuple(rows[i] - rows[i + 1] for i in range(rank))
+
+
+def _horizontal_strips(shape, size, previous_counts):
+    def strips(row, remaining, previous_total, current_total):
+        if row == len(shape):
+            if remaining == 0:
+                yield ()
+            return
+
+        upper = remaining if row == 0 else shape[row - 1] - shape[row]
+        if previous_counts is not None:
+            previous_total += previous_counts[row - 1] if row else 0
+            upper = min(upper, previous_total - current_total)
+
+        for count in range(min(upper, remaining), -1, -1):
+            for counts in strips(
+                    row + 1,
+                    remaining - count,
+                    previous_total,
+                    current_total + count
+            ):
+                yield (count,) + counts
+
+    return strips(0, size, 0, 0)
+
+
+@cached('young.littlewood_richardson')
+def littlewood_richardson(first, second, max_length):
+    if len(first) > max_length or len(second) > max_length:
+        return collections.Counter()
+
+    result = collections.Counter()
+
+    def add_boxes(shape, label, previous_counts):
+        if label == len(second):
+            result[tuple(row for row in shape if row)] += 1
+            return
+
+        for counts in _horizontal_strips(
+                shape,
+                second[label],
+                previous_counts
+        ):
+            add_boxes(
+                tuple(row + count for row, count in zip(shape, counts)),
+                label + 1,
+                counts
+            )
+
+    add_boxes(
+        tuple(first) + (0,) * (max_length - len(first)),
+        0,
+        None
+    )
+
+    return result
+
+
+@cached('young.integer_partitions')
+def integer_partitions(n, max_part=None):
+    if max_part is None:
+        max_part = n
+
+    if n == 0:
+        return [()]
+
+    return [
+        (first,) + partition
+        for first in range(min(n, max_part), 0, -1)
+        for partition in integer_partitions(n - first, first)
+    ]
+
+
+def conjugate_partition(partition):
+    return tuple(
+        sum(1 for row in partition if row > column)
+        for column in range(partition[0] if partition else 0)
+    )
+
+
+def centralizer_order(cycle_type):
+    order = 1
+    for part, multiplicity in collections.Counter(cycle_type).items():
+        order *= part**multiplicity * math.factorial(multiplicity)
+
+    return order
+
+
+@cached('young._murnaghan_nakayama')
+def _murnaghan_nakayama(beta_numbers, cycle_type):
+    if not cycle_type:
+        return 1
+
+    length, remaining_cycle_type = cycle_type[0], cycle_type[1:]
+    character = 0
+
+    for beta_number in beta_numbers:
+        lowered = beta_number - length
+        if lowered < 0 or lowered in beta_numbers:
+            continue
+
+        height = sum(
+            1 for other in beta_numbers if lowered < other < beta_number
+        )
+        character += (-1)**height * _murnaghan_nakayama(
+            tuple(sorted(
+                lowered if other == beta_number else other
+                for other in beta_numbers
+            )),
+            remaining_cycle_type
+        )
+
+    return character
+
+
+def symmetric_group_character(partition, cycle_type):
+    length = len(partition)
+    beta_numbers = tuple(sorted(
+        row + length - 1 - i for i, row in enumerate(partition)
+    ))
+
+    return _murnaghan_nakayama(beta_numbers, tuple(cycle_type))
+
+
+def _contents_and_hooks(partition):
+    conjugate = conjugate_partition(partition)
+
+    return [
+        (column - row, partition[row] - column + conjugate[column] - row - 1)
+        for row in range(len(partition))
+        for column in range(partition[row])
+    ]
+
+
+def schur_dimension(partition, n):
+    numerator = denominator = 1
+    for content, hook in _contents_and_hooks(partition):
+        numerator *= n + content
+        denominator *= hook
+
+    return numerator // denominator
+
+
+def schur_dimension_polynomial(partition):
+    coefficients = [Fraction(1)]
+    for content, hook in _contents_and_hooks(partition):
+        coefficients = [
+            (
+                (coefficients[i - 1] if i > 0 else 0)
+                + content * (coefficients[i] if i < len(coefficients) else 0)
+            ) / hook
+            for i in range(len(coefficients) + 1)
+        ]
+
+    return coefficients
@@ -25,6 +25,21 @@ def parse_arguments():
         help='Number of fermion flavors'
     )
 
+    argument_parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        default=1,
+        help='Number of worker processes'
+    )
+
+    argument_parser.add_argument(
+        '--checkpoint',
+        metavar='PATH',
+        default=None,
+        help='File where finished operators are saved, to resume the run'
+    )
+
     argument_parser.add_argument(
         '--profile',
         action='store_const',
@@ -60,6 +75,13 @@ def parse_arguments():
         const=True
     )
 
+    argument_parser.add_argument(
+        '--hilbert_series',
+        action='store_const',
+        default=False,
+        const=True
+    )
+
     return argument_parser.parse_args()
 
 
@@ -78,13 +100,18 @@ if __name__ == '__main__':
         eft.fields[6].use_eom = True
         eft.fields[8].use_eom = True
 
-        operators_generator = eft.invariants
+        if arguments.hilbert_series:
+            operators_generator = eft.hilbert_series
+        else:
+            operators_generator = eft.invariants
 
     operators = operators_generator(
         arguments.dimension,
         verbose=True,
         ignore_lower_dimension=not arguments.include_lower_dimension,
-        use_eom=not arguments.no_eom
+        use_eom=not arguments.no_eom,
+        workers=arguments.workers,
+        checkpoint=arguments.checkpoint
     )
 
     if arguments.profile:
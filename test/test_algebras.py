@@ -1,6 +1,8 @@
 from basisgen.algebras import Series, SimpleAlgebra, SemisimpleAlgebra
+from basisgen.representations import Irrep
 from basisgen.weights import Weight
 
+import pickle
 import unittest
 
 
@@ -8,6 +10,7 @@ class TestSimpleAlgebra(unittest.TestCase):
     def setUp(self):
         self.a1 = SimpleAlgebra(Series.A, 1)
         self.a2 = SimpleAlgebra(Series.A, 2)
+        self.b2 = SimpleAlgebra(Series.B, 2)
         self.b4 = SimpleAlgebra(Series.B, 4)
         self.c6 = SimpleAlgebra(Series.C, 6)
         self.d5 = SimpleAlgebra(Series.D, 5)
@@ -100,6 +103,7 @@ class TestSimpleAlgebra(unittest.TestCase):
         known_highest_roots = {
             self.a1: Weight([2]),
             self.a2: Weight([1, 1]),
+            self.b2: Weight([0, 2]),
             self.b4: Weight([0, 1, 0, 0]),
             self.c6: Weight([2, 0, 0, 0, 0, 0]),
             self.d5: Weight([0, 1, 0, 0, 0]),
@@ -209,6 +213,71 @@ class TestSimpleAlgebra(unittest.TestCase):
         for algebra, metric in known_metrics.items():
             self.assertEqual(algebra.metric, metric)
 
+    def test_integer_metric(self):
+        known_denominators = {
+            self.a1: 2, self.a2: 3, self.b4: 2, self.c6: 2, self.d5: 4,
+            self.e6: 3, self.e7: 2, self.e8: 1, self.f4: 2, self.g2: 3
+        }
+
+        for algebra, denominator in known_denominators.items():
+            self.assertEqual(algebra.metric_denominator, denominator)
+            self.assertEqual(
+                [
+                    [element / denominator for element in row]
+                    for row in algebra.integer_metric
+                ],
+                algebra.metric
+            )
+
+        self.assertEqual(
+            self.e6.scaled_norm_squared(self.e6.highest_root),
+            2 * self.e6.metric_denominator
+        )
+
+    def test_weyl_denominator(self):
+        for algebra in [self.a1, self.a2, self.b4, self.f4, self.g2]:
+            denominator = algebra.weyl_denominator
+
+            self.assertEqual(len(denominator), algebra.weyl_group_order)
+            self.assertEqual(sum(denominator.values()), 0)
+            self.assertEqual(denominator[Weight([0] * algebra.rank)], 1)
+
+    def test_weyl_orbits(self):
+        for algebra in [self.a2, self.b4, self.d5, self.e6, self.g2]:
+            self.assertEqual(
+                len(algebra.weyl_orbit(algebra.sum_of_positive_roots)),
+                algebra.weyl_group_order
+            )
+
+        for algebra in [self.a2, self.d5, self.e6]:
+            self.assertEqual(
+                len(algebra.weyl_orbit(algebra.highest_root)),
+                2 * len(Irrep.positive_roots(algebra))
+            )
+
+    def test_algebra_data(self):
+        known_numbers_of_positive_roots = {
+            self.a2: 3, self.b4: 16, self.c6: 36, self.d5: 20,
+            self.e6: 36, self.e7: 63, self.e8: 120, self.f4: 24, self.g2: 6
+        }
+
+        for algebra, count in known_numbers_of_positive_roots.items():
+            data = algebra.data
+            self.assertIs(algebra.data, data)
+            self.assertEqual(len(data.positive_roots), count)
+            self.assertEqual(data.positive_roots[0], algebra.highest_root)
+            self.assertEqual(
+                set(data.simple_roots),
+                set(data.positive_roots[-algebra.rank:])
+            )
+            self.assertEqual(
+                sum(data.positive_roots, Weight([0] * algebra.rank)),
+                2 * data.rho
+            )
+
+        self.assertEqual(self.a2.data.integer_metric, ((2, 1), (1, 2)))
+        self.assertEqual(self.a2.data.metric_denominator, 3)
+
 
 class TestSemisimpleAlgebra(unittest.TestCase):
     def setUp(self):
@@ -228,6 +297,33 @@ class TestSemisimpleAlgebra(unittest.TestCase):
             self.algebra
         )
 
+    def test_interning(self):
+        self.assertIs(SimpleAlgebra(Series.A, 2), self.a2)
+        self.assertIs(SemisimpleAlgebra(list(self.algebras)), self.algebra)
+        self.assertIs(
+            SemisimpleAlgebra([self.a1, self.a2]),
+            self.algebra[:2]
+        )
+        self.assertNotEqual(
+            SemisimpleAlgebra([self.a1]),
+            SemisimpleAlgebra([self.a1, self.a1])
+        )
+
+        irrep = Irrep(self.algebra[:2], Weight([1, 0, 1]))
+        self.assertIs(Irrep(self.algebra[:2], [1, 0, 1]), irrep)
+        self.assertIs(pickle.loads(pickle.dumps(irrep)), irrep)
+        self.assertIs(pickle.loads(pickle.dumps(self.algebra)), self.algebra)
+
+    def test_algebra_data(self):
+        data = self.algebra[1:3].data
+        self.assertEqual(data.metric_denominator, 30)
+        self.assertEqual(data.integer_metric[0], (20, 10) + (0,) * 9)
+        self.assertEqual(
+            len(data.positive_roots),
+            len(self.a2.data.positive_roots)
+            + len(self.a9.data.positive_roots)
+        )
+
     def test_split_weight(self):
         self.assertEqual(
             self.algebra.split_weight(Weight([
@@ -0,0 +1,165 @@
+from basisgen.algebras import Series, SimpleAlgebra
+from basisgen.representations import Irrep
+from basisgen.statistics import Statistics
+from basisgen.weights import Weight
+from basisgen.smeft import smeft
+from basisgen.cache import (
+    PersistentCache, enable_persistent_cache, disable_persistent_cache,
+    Cache, cached, cache_statistics, set_cache_limit, clear_caches,
+    DEFAULT_WEIGHTS_MAXSIZE
+)
+
+import os
+import tempfile
+import unittest
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.sqlite')
+        os.close(handle)
+
+    def tearDown(self):
+        disable_persistent_cache()
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        su3 = SimpleAlgebra(Series.A, 2)
+        triplet = Irrep(su3, Weight([1, 0]))
+
+        cache = enable_persistent_cache(self.path)
+        expected_product = triplet._mul_simple_irreps(triplet)
+        expected_power = triplet.power(2, Statistics.BOSON)
+        expected_weights = triplet._simple_weight_system()
+        self.assertGreater(len(cache), 0)
+
+        for _ in range(2):
+            self.assertEqual(
+                Irrep._mul_simple_irreps.__wrapped__(triplet, triplet),
+                expected_product
+            )
+            self.assertEqual(
+                Irrep.power.__wrapped__(
+                    triplet, 2, Statistics.BOSON
+                ),
+                expected_power
+            )
+            self.assertEqual(
+                triplet._simple_weight_system().weights,
+                expected_weights.weights
+            )
+            enable_persistent_cache(self.path)
+
+    def test_eviction(self):
+        cache = PersistentCache(self.path, max_entries=2)
+        for index in range(5):
+            cache.set(str(index), index)
+        cache.flush()
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('4'), 4)
+        with self.assertRaises(KeyError):
+            cache.get('0')
+
+    def test_reads_do_not_write(self):
+        cache = PersistentCache(self.path)
+        cache.set('key', 'value')
+        changes = cache.connection.total_changes
+
+        self.assertEqual(cache.get('key'), 'value')
+        self.assertEqual(cache.connection.total_changes, changes)
+
+    def test_parallel_invariants(self):
+        serial_invariants = smeft(1).invariants(6)
+
+        cache = enable_persistent_cache(self.path)
+        for _ in range(2):
+            clear_caches()
+            self.assertEqual(
+                smeft(1).invariants(6, workers=2),
+                serial_invariants
+            )
+        self.assertGreater(len(cache), 0)
+
+    def test_version(self):
+        cache = PersistentCache(self.path)
+        cache.set('key', 'value')
+        cache.connection.execute(
+            "UPDATE metadata SET value = 'stale' WHERE key = 'version'"
+        )
+        cache.close()
+
+        self.assertEqual(len(PersistentCache(self.path)), 0)
+
+
+class TestCacheRegistry(unittest.TestCase):
+    def test_eviction(self):
+        cache = Cache('test', maxsize=5, cost=len)
+        cache.set('a', [1, 2])
+        cache.set('b', [1, 2])
+        self.assertEqual(cache.get('a'), [1, 2])
+        cache.set('c', [1, 2])
+
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('b', 'missing'), 'missing')
+        self.assertEqual(
+            cache.statistics(),
+            (1, 1, 1, 2, 4, 5)
+        )
+
+        cache.resize(2)
+        self.assertEqual(list(cache._entries), ['c'])
+
+    def test_registry(self):
+        calls = []
+
+        @cached('TestCacheRegistry.square')
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([square(2), square(2), square(x=2)], [4, 4, 4])
+        self.assertEqual(calls, [2, 2])
+        self.assertEqual(
+            cache_statistics()['TestCacheRegistry.square'].hits,
+            1
+        )
+
+        set_cache_limit('TestCacheRegistry.square', 1)
+        square(3)
+        self.assertEqual(len(square.cache), 1)
+
+        clear_caches('TestCacheRegistry.square')
+        self.assertEqual(len(square.cache), 0)
+
+    def test_default_limits(self):
+        statistics = cache_statistics()
+
+        for name in [
+                'young.littlewood_richardson',
+                'young.integer_partitions',
+                'partitions.partitions',
+                'Irrep._mul_simple_irreps',
+                'Irrep.power',
+                'Irrep.weight_system',
+                'Irrep.power_weight_system',
+                'Operator.derivative_levels',
+                'Field.graded_power'
+        ]:
+            self.assertIsNotNone(statistics[name].maxsize)
+
+    def test_bounded_weight_system_caches(self):
+        su2 = SimpleAlgebra(Series.A, 1)
+        set_cache_limit('Irrep.power_weight_system', 20)
+
+        for highest_weight in range(10):
+            irrep = Irrep(su2, Weight([highest_weight]))
+            irrep.power_weight_system(2, Statistics.BOSON)
+
+        statistics = cache_statistics()['Irrep.power_weight_system']
+        self.assertLessEqual(statistics.cost, 20)
+        self.assertGreater(statistics.size, 0)
+        set_cache_limit(
+            'Irrep.power_weight_system',
+            DEFAULT_WEIGHTS_MAXSIZE
+        )
@@ -0,0 +1,59 @@
+from basisgen.hilbert import GradedWeightSystem
+from basisgen.representations import Irrep, WeightSystem
+from basisgen.algebras import SimpleAlgebra, Series
+from basisgen.statistics import Statistics
+from basisgen.weights import Weight
+
+import unittest
+
+
+class TestHilbert(unittest.TestCase):
+    def test_graded_powers(self):
+        algebra = SimpleAlgebra(Series.A, 2)
+        triplet = Irrep(algebra, Weight([1, 0]))
+        antitriplet = Irrep(algebra, Weight([0, 1]))
+        graded = GradedWeightSystem(
+            [triplet.weight_system, antitriplet.weight_system],
+            3
+        )
+
+        for statistics in Statistics:
+            powers = graded.power(2, statistics)
+            self.assertEqual(
+                powers.grades[0].weights,
+                triplet.power_weight_system(2, statistics).weights
+            )
+            self.assertEqual(
+                powers.grades[1].weights,
+                (triplet.weight_system * antitriplet.weight_system).weights
+            )
+            self.assertEqual(
+                powers.grades[2].weights,
+                antitriplet.power_weight_system(2, statistics).weights
+            )
+            self.assertEqual(powers.grades[3].weights, {})
+
+    def test_singlet_multiplicities(self):
+        algebra = SimpleAlgebra(Series.A, 2)
+        triplet = Irrep(algebra, Weight([1, 0]))
+        antitriplet = Irrep(algebra, Weight([0, 1]))
+        graded = GradedWeightSystem(
+            [triplet.weight_system, antitriplet.weight_system],
+            2
+        )
+        virtual = GradedWeightSystem(
+            [
+                WeightSystem({
+                    weight: -count
+                    for weight, count in antitriplet.weight_system
+                })
+            ],
+            2
+        )
+
+        self.assertEqual(graded.singlet_multiplicities(graded, algebra), [
+            0, 2, 0
+        ])
+        self.assertEqual(graded.singlet_multiplicities(virtual, algebra), [
+            -1, 0, 0
+        ])
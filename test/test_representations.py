@@ -1,9 +1,12 @@
-from basisgen.algebras import Series, SimpleAlgebra
-from basisgen.representations import Irrep
+from basisgen.algebras import Series, SimpleAlgebra, SemisimpleAlgebra
+from basisgen.representations import Irrep, IrrepCounter, WeightSystem
+from basisgen.statistics import Statistics
 from basisgen.weights import Weight
 
 import unittest
 import collections
+import itertools
+from fractions import Fraction
 
 
 class TestIrrep(unittest.TestCase):
@@ -58,6 +61,41 @@ class TestIrrep(unittest.TestCase):
         for irrep, weights in known_weights.items():
             self.assertEqual(irrep.weight_system.weights, weights)
 
+    def test_dominant_weights(self):
+        known_dominant_multiplicities = {
+            Irrep(SimpleAlgebra(Series.A, 2), Weight([2, 2])): {
+                Weight([2, 2]): 1,
+                Weight([3, 0]): 1, Weight([0, 3]): 1,
+                Weight([1, 1]): 2,
+                Weight([0, 0]): 3
+            },
+
+            Irrep(SimpleAlgebra(Series.D, 5), Weight([0, 0, 0, 1, 1])): {
+                Weight([0, 0, 0, 1, 1]): 1,
+                Weight([0, 1, 0, 0, 0]): 3,
+                Weight([0, 0, 0, 0, 0]): 10
+            },
+
+            Irrep(SimpleAlgebra(Series.B, 2), Weight([0, 2])): {
+                Weight([0, 2]): 1,
+                Weight([1, 0]): 1,
+                Weight([0, 0]): 2
+            }
+        }
+
+        for irrep, multiplicities in known_dominant_multiplicities.items():
+            self.assertEqual(
+                dict(irrep.dominant_weights_with_multiplicities),
+                multiplicities
+            )
+            self.assertEqual(
+                sum(
+                    multiplicity * len(irrep.algebra.weyl_orbit(weight))
+                    for weight, multiplicity in multiplicities.items()
+                ),
+                sum(irrep.weight_system.weights.values())
+            )
+
     def test_su3_tensor_products(self):
         SU3_algebra = SimpleAlgebra(Series.A, 2)
 
@@ -124,6 +162,395 @@ class TestIrrep(unittest.TestCase):
         for product, decomposition in known_decompositions:
             self.assertEqual(product, collections.Counter(decomposition))
 
+    def test_weight_system_products(self):
+        first = Irrep(SimpleAlgebra(Series.A, 2), Weight([2, 1]))
+        second = Irrep(SimpleAlgebra(Series.A, 2), Weight([1, 1]))
+
+        self.assertEqual(
+            (first.weight_system * second.weight_system).weights,
+            collections.Counter(
+                first_weight + second_weight
+                for first_weight in first.weight_system.weights.elements()
+                for second_weight in second.weight_system.weights.elements()
+            )
+        )
+
+        semisimple_irrep = first + second
+        self.assertEqual(
+            semisimple_irrep.weight_system.weights,
+            collections.Counter(
+                first_weight.concat(second_weight)
+                for first_weight in first.weight_system.weights.elements()
+                for second_weight in second.weight_system.weights.elements()
+            )
+        )
+
+    def test_singlet_multiplicity(self):
+        algebras_and_weights = [
+            (SimpleAlgebra(Series.A, 2), [[1, 1], [1, 1], [1, 1]]),
+            (SimpleAlgebra(Series.A, 2), [[2, 0], [0, 1], [1, 1]]),
+            (SimpleAlgebra(Series.B, 2), [[1, 0], [0, 2], [0, 1], [0, 1]]),
+            (SimpleAlgebra(Series.G, 2), [[1, 0], [0, 1], [1, 0]])
+        ]
+
+        for algebra, highest_weights in algebras_and_weights:
+            irreps = [
+                Irrep(algebra, Weight(highest_weight))
+                for highest_weight in highest_weights
+            ]
+
+            weight_system = irreps[0].weight_system
+            product = irreps[0] * irreps[1]
+            for irrep in irreps[1:]:
+                weight_system = weight_system * irrep.weight_system
+            for irrep in irreps[2:]:
+                product = product * irrep
+
+            semisimple_algebra = SemisimpleAlgebra([algebra])
+            first_half = irreps[0].weight_system
+            for irrep in irreps[1:-1]:
+                first_half = first_half * irrep.weight_system
+            projections = [
+                weight_system.singlet_projection(semisimple_algebra, 0),
+                first_half.product_singlet_projection(
+                    irreps[-1].weight_system,
+                    semisimple_algebra,
+                    0
+                )
+            ]
+
+            for projection in projections:
+                self.assertEqual(
+                    projection.weights.get(Weight([]), 0),
+                    product[Irrep.singlet(algebra)]
+                )
+
+    def test_powers(self):
+        octet = Irrep(SimpleAlgebra(Series.A, 2), Weight([1, 1]))
+
+        def su3_irreps(*highest_weights):
+            return collections.Counter(
+                Irrep(octet.algebra, Weight(highest_weight))
+                for highest_weight in highest_weights
+            )
+
+        self.assertEqual(
+            octet.power(2, Statistics.BOSON),
+            su3_irreps([0, 0], [1, 1], [2, 2])
+        )
+        self.assertEqual(
+            octet.power(2, Statistics.FERMION),
+            su3_irreps([1, 1], [3, 0], [0, 3])
+        )
+        self.assertEqual(
+            octet.power(8, Statistics.FERMION),
+            su3_irreps([0, 0])
+        )
+        self.assertEqual(octet.power(9, Statistics.FERMION), su3_irreps())
+
+        combinations_functions = {
+            Statistics.BOSON: itertools.combinations_with_replacement,
+            Statistics.FERMION: itertools.combinations
+        }
+
+        for exponent in range(5):
+            for statistics, combinations_function in (
+                    combinations_functions.items()
+            ):
+                self.assertEqual(
+                    octet.power_weight_system(exponent, statistics).weights,
+                    collections.Counter(
+                        sum(combination, Weight([0, 0]))
+                        for combination in combinations_function(
+                                octet.weight_system.weights.elements(),
+                                exponent
+                        )
+                    )
+                )
+
+    def test_su2_closed_forms(self):
+        su2 = SimpleAlgebra(Series.A, 1)
+        vector = Irrep(SemisimpleAlgebra([su2, su2]), Weight([1, 1]))
+
+        def generic_power(irrep, exponent, statistics):
+            return irrep.power_weight_system(exponent, statistics).decompose(
+                irrep.algebra
+            )
+
+        for first in range(6):
+            first_irrep = Irrep(su2, Weight([first]))
+
+            for second in range(6):
+                second_irrep = Irrep(su2, Weight([second]))
+                self.assertEqual(
+                    first_irrep * second_irrep,
+                    (
+                        first_irrep.weight_system
+                        * second_irrep.weight_system
+                    ).decompose(su2)
+                )
+
+            for exponent in range(6):
+                for statistics in Statistics:
+                    self.assertEqual(
+                        first_irrep.power(exponent, statistics),
+                        generic_power(first_irrep, exponent, statistics)
+                    )
+
+        for exponent in range(6):
+            self.assertEqual(
+                vector.power(exponent, Statistics.BOSON),
+                generic_power(vector, exponent, Statistics.BOSON)
+            )
+
+    def test_littlewood_richardson_products(self):
+        for rank in range(1, 4):
+            algebra = SimpleAlgebra(Series.A, rank)
+            irreps = [
+                Irrep(algebra, Weight(highest_weight))
+                for highest_weight in itertools.product(range(3), repeat=rank)
+                if sum(highest_weight) <= 3
+            ]
+
+            for first, second in itertools.product(irreps, repeat=2):
+                self.assertEqual(
+                    first._littlewood_richardson_product(second),
+                    first._weight_system_product(second)
+                )
+
+    def test_brauer_klimyk_products(self):
+        algebras = [
+            SimpleAlgebra(Series.B, 3),
+            SimpleAlgebra(Series.C, 3),
+            SimpleAlgebra(Series.D, 4),
+            SimpleAlgebra(Series.G, 2),
+            SimpleAlgebra(Series.F, 4)
+        ]
+
+        for algebra in algebras:
+            irreps = [
+                Irrep(algebra, Weight(highest_weight))
+                for highest_weight
+                in itertools.product(range(2), repeat=algebra.rank)
+                if sum(highest_weight) <= 1
+            ]
+
+            for first, second in itertools.product(irreps, repeat=2):
+                self.assertEqual(
+                    first._brauer_klimyk_product(second),
+                    first._weight_system_product(second)
+                )
+
+    def test_metadata(self):
+        algebras = [
+            SimpleAlgebra(Series.A, 3),
+            SimpleAlgebra(Series.B, 3),
+            SimpleAlgebra(Series.C, 3),
+            SimpleAlgebra(Series.D, 5),
+            SimpleAlgebra(Series.G, 2),
+            SimpleAlgebra(Series.E, 6)
+        ]
+
+        for algebra in algebras:
+            for highest_weight in itertools.product(
+                    range(2), repeat=algebra.rank
+            ):
+                if sum(highest_weight) > 1:
+                    continue
+
+                irrep = Irrep(algebra, Weight(highest_weight))
+                weight_system = irrep.weight_system
+                lowest_weight = next(iter(
+                    weight_system.sorted_weights(algebra)
+                ))
+
+                self.assertEqual(
+                    irrep.dimension,
+                    sum(weight_system.weights.values())
+                )
+                self.assertEqual(
+                    irrep.conjugate,
+                    Irrep(algebra, -lowest_weight)
+                )
+
+        known_indices = {
+            (SimpleAlgebra(Series.A, 1), (1,)): Fraction(1, 2),
+            (SimpleAlgebra(Series.A, 4), (1, 0, 0, 1)): 5,
+            (SimpleAlgebra(Series.D, 5), (0, 0, 0, 0, 1)): 2,
+            (SimpleAlgebra(Series.E, 6), (1, 0, 0, 0, 0, 0)): 3,
+            (SimpleAlgebra(Series.G, 2), (0, 1)): 1
+        }
+
+        for (algebra, highest_weight), index in known_indices.items():
+            self.assertEqual(
+                Irrep(algebra, Weight(highest_weight)).index,
+                index
+            )
+
+        su3 = SimpleAlgebra(Series.A, 2)
+        self.assertEqual(
+            Irrep(su3, Weight([1, 0])).congruence_class,
+            (Fraction(2, 3), Fraction(1, 3))
+        )
+        self.assertEqual(
+            Irrep(su3, Weight([1, 1])).congruence_class,
+            (0, 0)
+        )
+
+    def test_decompose(self):
+        algebra = SemisimpleAlgebra([
+            SimpleAlgebra(Series.A, 2),
+            SimpleAlgebra(Series.A, 1)
+        ])
+
+        def irreps(*highest_weights):
+            return collections.Counter(
+                Irrep(algebra, Weight(highest_weight))
+                for highest_weight in highest_weights
+            )
+
+        quark = Irrep(algebra, Weight([1, 0, 1]))
+        antiquark = Irrep(algebra, Weight([0, 1, 1]))
+
+        self.assertEqual(
+            quark.dominant_multiplicities,
+            {Weight([1, 0, 1]): 1}
+        )
+        self.assertEqual(
+            (quark.weight_system * antiquark.weight_system).decompose(
+                algebra
+            ),
+            irreps([1, 1, 2], [1, 1, 0], [0, 0, 2], [0, 0, 0])
+        )
+
+    def test_targeted_products(self):
+        su3 = SimpleAlgebra(Series.A, 2)
+        triplet = Irrep(su3, Weight([1, 0]))
+        antitriplet = Irrep(su3, Weight([0, 1]))
+        octet = Irrep(su3, Weight([1, 1]))
+        sextet = Irrep(su3, Weight([2, 0]))
+
+        factors = [
+            octet,
+            triplet.power(2, Statistics.BOSON),
+            antitriplet,
+            sextet.power(2, Statistics.FERMION),
+            triplet
+        ]
+        full_product = IrrepCounter.product(factors)
+        self.assertEqual(full_product[Irrep.singlet(su3)], 6)
+
+        for targets in [[Irrep.singlet(su3)], [octet, triplet, sextet]]:
+            self.assertEqual(
+                IrrepCounter.product(factors, targets),
+                {
+                    target: full_product[target]
+                    for target in targets
+                    if full_product[target]
+                }
+            )
+
+    def test_cached_weight_data(self):
+        algebra = SimpleAlgebra(Series.G, 2)
+        irrep = Irrep(algebra, Weight([1, 1]))
+        weight_system = irrep.weight_system
+        self.assertIs(irrep.weight_system, weight_system)
+
+        heights = [
+            algebra.height(weight)
+            for weight in weight_system.sorted_weights(algebra)
+        ]
+        self.assertEqual(heights, sorted(heights))
+        self.assertEqual(
+            weight_system.sorted_weights(algebra),
+            WeightSystem(weight_system.weights).sorted_weights(algebra)
+        )
+
+        weights_by_level = irrep.weights_by_level
+        self.assertIs(irrep.weights_by_level, weights_by_level)
+        self.assertEqual(weights_by_level[0], (irrep.highest_weight,))
+        self.assertEqual(
+            sum(map(len, weights_by_level.values())),
+            len(weight_system.weights)
+        )
+
+        triplet_doublet = Irrep(
+            SimpleAlgebra(Series.A, 2) + SimpleAlgebra(Series.A, 1),
+            Weight([1, 0, 1])
+        )
+        self.assertEqual(
+            [
+                list(weights)
+                for weights in triplet_doublet.weights_view().weights
+            ],
+            [
+                [Weight([1, 0, 1])],
+                [Weight([-1, 1, 1]), Weight([1, 0, -1])],
+                [Weight([0, -1, 1]), Weight([-1, 1, -1])],
+                [Weight([0, -1, -1])]
+            ]
+        )
+
+    def test_weights_by_level(self):
+        algebras_and_weights = [
+            (SimpleAlgebra(Series.A, 3), Weight([2, 0, 1])),
+            (SimpleAlgebra(Series.B, 3), Weight([1, 0, 1])),
+            (SimpleAlgebra(Series.G, 2), Weight([2, 1])),
+            (
+                SimpleAlgebra(Series.A, 1) + SimpleAlgebra(Series.C, 2),
+                Weight([1, 1, 1])
+            )
+        ]
+
+        for algebra, highest_weight in algebras_and_weights:
+            irrep = Irrep(algebra, highest_weight)
+            levels = list(irrep.iter_weights_by_level())
+            weights = [weight for _, level in levels for weight in level]
+
+            self.assertEqual(
+                [level for level, _ in levels],
+                list(range(len(levels)))
+            )
+            self.assertEqual(len(weights), len(set(weights)))
+            self.assertEqual(set(weights), set(irrep.weight_system.weights))
+            self.assertEqual(
+                [len(level) for _, level in levels],
+                [len(level) for _, level in reversed(levels)]
+            )
+
+            for level, level_weights in levels:
+                for weight in level_weights:
+                    self.assertEqual(
+                        algebra.height(weight),
+                        algebra.height(highest_weight) - 2 * level
+                    )
+
+    def test_schur_functors(self):
+        octet = Irrep(SimpleAlgebra(Series.A, 2), Weight([1, 1]))
+
+        for exponent in range(4):
+            self.assertEqual(
+                octet.schur_weight_system((exponent,)).weights,
+                octet.power_weight_system(exponent, Statistics.BOSON).weights
+            )
+            self.assertEqual(
+                octet.schur_weight_system((1,) * exponent).weights,
+                octet.power_weight_system(
+                    exponent, Statistics.FERMION
+                ).weights
+            )
+
+        self.assertEqual(
+            octet.schur_weight_system((2, 1)).decompose(octet.algebra),
+            octet.weight_system.schur_functor((2, 1)).decompose(
+                octet.algebra
+            )
+        )
+        self.assertEqual(
+            sum(octet.schur_weight_system((2, 1)).weights.values()),
+            168
+        )
+
     def test_positive_roots(self):
         known_positive_roots = {
             SimpleAlgebra(Series.A, 2): {
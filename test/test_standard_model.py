@@ -1,7 +1,13 @@
 from basisgen.eft import Operator, EFT
-from basisgen.smeft import sm_gauge_algebra, smeft, phi, phic, u, uc, GL, GR
+from basisgen.smeft import (
+    sm_gauge_algebra, smeft, phi, phic, u, uc, Q, Qc, L, Lc, GL, GR
+)
+from basisgen.representations import Irrep
 from basisgen.weights import Weight
 
+import concurrent.futures
+import os
+import tempfile
 import unittest
 from collections import Counter
 
@@ -34,6 +40,169 @@ class TestSMEFT(unittest.TestCase):
             invariants
         )
 
+    def test_parallel_invariants(self):
+        eft = smeft(1)
+        serial_invariants = eft.invariants(6)
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            executor_invariants = eft.invariants(6, executor=executor)
+
+        for invariants in [eft.invariants(6, workers=2), executor_invariants]:
+            self.assertEqual(invariants, serial_invariants)
+            self.assertEqual(
+                list(invariants.invariants),
+                list(serial_invariants.invariants)
+            )
+
+        higgs_only = EFT(sm_gauge_algebra, [phi, phic])
+        self.assertEqual(
+            higgs_only.covariants(4, workers=2).covariants,
+            higgs_only.covariants(4).covariants
+        )
+
+    def test_incremental_invariants(self):
+        eft = smeft(1)
+        eft.invariants(5)
+        operator = phi**2 * phic**2
+        self.assertGreaterEqual(
+            len(eft.cached_results[('levels', True)][operator]),
+            2
+        )
+
+        invariants = eft.invariants(6, workers=2)
+        self.assertGreaterEqual(
+            len(eft.cached_results[('levels', True)][operator]),
+            3
+        )
+        self.assertEqual(invariants.invariants[operator], {0: 1, 2: 2})
+
+        for max_dimension in [6, 7]:
+            self.assertEqual(
+                eft.invariants(max_dimension),
+                EFT(
+                    sm_gauge_algebra,
+                    smeft(1).fields
+                ).invariants(max_dimension)
+            )
+
+    def test_checkpoint(self):
+        eft = smeft(1)
+        serial_invariants = eft.invariants(6)
+        higgs_only = EFT(sm_gauge_algebra, [phi, phic])
+        serial_covariants = higgs_only.covariants(4)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint.jsonl')
+
+            stream = eft.iter_invariants(6, checkpoint=path)
+            streamed = [next(stream) for _ in range(10)]
+            self.assertEqual(
+                streamed,
+                list(serial_invariants.invariants.items())[:10]
+            )
+            stream.close()
+
+            with open(path, 'a') as checkpoint_file:
+                checkpoint_file.write('{"settings": ')
+
+            self.assertEqual(
+                smeft(1).invariants(6, checkpoint=path),
+                serial_invariants
+            )
+            self.assertEqual(
+                smeft(1).invariants(6, checkpoint=path, workers=2),
+                serial_invariants
+            )
+
+            for _ in range(2):
+                self.assertEqual(
+                    higgs_only.covariants(4, checkpoint=path).covariants,
+                    serial_covariants.covariants
+                )
+
+            with open(path) as checkpoint_file:
+                self.assertEqual(
+                    len(checkpoint_file.readlines()),
+                    len(serial_invariants.invariants)
+                    + len(list(higgs_only.iter_covariants(4)))
+                )
+
+            smeft(1).invariants(5, checkpoint=path)
+            self.assertEqual(
+                smeft(3).invariants(5, checkpoint=path),
+                smeft(3).invariants(5)
+            )
+
+    def test_neutral_operators(self):
+        sm = smeft(1)
+        for dimension in range(1, 8):
+            self.assertEqual(
+                list(sm.operators(dimension, neutral=True)),
+                [
+                    operator for operator in sm.operators(dimension)
+                    if operator.is_neutral
+                ]
+            )
+
+    def test_invariants_by_signature(self):
+        operator = Operator(Counter({Q(): 3, L(): 1}))
+        conjugate = Operator(Counter({Qc(): 3, Lc(): 1}))
+        self.assertEqual(operator.signature, conjugate.signature)
+        self.assertNotEqual(
+            operator.signature,
+            Operator(Counter({Q(): 2, Qc(): 1, L(): 1})).signature
+        )
+        self.assertNotEqual(
+            Operator(Counter({GL: 2})).signature,
+            Operator(Counter({GR: 2})).signature
+        )
+
+        invariants = operator.invariants(7)
+        self.assertEqual(conjugate.invariants(7), invariants)
+        self.assertEqual(
+            conjugate.level_invariants(
+                conjugate.derivative_levels(7, True, []),
+                7
+            ),
+            invariants
+        )
+
+        invariants.clear()
+        self.assertNotEqual(operator.invariants(7), invariants)
+
+    def test_flavor_invariants(self):
+        invariants = smeft(None).flavor_invariants(
+            6, ignore_lower_dimension=True
+        )
+
+        for number_of_flavors in [1, 2]:
+            self.assertEqual(
+                invariants.evaluate(number_of_flavors),
+                smeft(number_of_flavors).invariants(
+                    6, ignore_lower_dimension=True
+                )
+            )
+
+        self.assertEqual(
+            sum(
+                coefficient * 3**power
+                for power, coefficient in enumerate(invariants.count())
+            ),
+            3045
+        )
+
+    def test_hilbert_series(self):
+        for use_eom in [True, False]:
+            self.assertEqual(
+                smeft(1).hilbert_series(6, use_eom=use_eom),
+                smeft(1).invariants(6, use_eom=use_eom)
+            )
+
+        self.assertEqual(
+            smeft(3).hilbert_series(6, ignore_lower_dimension=True).count(),
+            3045
+        )
+
     def test_3_flavors(self):
         self.assertEqual(smeft(3).invariants(4).count(), 62)
 
@@ -45,6 +214,23 @@ class TestSMEFT(unittest.TestCase):
             {1: 3}
         )
 
+    def test_internal_singlets(self):
+        operators = [
+            phi * phic,
+            phi**2 * phic**2,
+            u(1) * uc(1) * GL,
+            u(1) * uc(1) * GL * GR
+        ]
+
+        for operator in operators:
+            for use_eom in [True, False]:
+                irreps = operator.irreps_with_derivatives(8, True, use_eom)
+                for n_derivatives, singlets in irreps.items():
+                    self.assertEqual(
+                        operator.internal_singlets(n_derivatives, use_eom),
+                        singlets
+                    )
+
     def test_covariants_higgs(self):
         covariants = EFT(sm_gauge_algebra, [phi, phic]).covariants(3)
 
@@ -62,6 +248,32 @@ class TestSMEFT(unittest.TestCase):
                 known_covariants[key]
             )
 
+    def test_targeted_covariants(self):
+        eft = smeft(1)
+        all_covariants = eft.covariants(5).covariants
+        targets = [
+            Irrep(eft.algebra, lorentz_weight.concat(internal_weight))
+            for lorentz_weight, internal_weight in [
+                (Weight([0, 0]), Weight([0, 0, 0])),
+                (Weight([1, 0]), Weight([0, 0, 1])),
+                (Weight([1, 1]), Weight([1, 1, 0]))
+            ]
+        ]
+        target_weights = {
+            (target.highest_weight[:2], target.highest_weight[2:])
+            for target in targets
+        }
+
+        covariants = eft.covariants(5, targets=targets).covariants
+        self.assertEqual(
+            covariants,
+            {
+                key: counter for key, counter in all_covariants.items()
+                if key[:2] in target_weights
+            }
+        )
+        self.assertGreater(len(covariants), 3)
+
 
 if __name__ == '__main__':
     unittest.main()
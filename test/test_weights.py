@@ -0,0 +1,51 @@
+from basisgen.weights import Weight, WeightBox
+
+import pickle
+import unittest
+
+
+class TestWeight(unittest.TestCase):
+    def test_arithmetic(self):
+        first = Weight([1, -2, 3])
+        second = Weight([0, 4, -1])
+
+        self.assertEqual(first + second, Weight([1, 2, 2]))
+        self.assertEqual(first - second, Weight([1, -6, 4]))
+        self.assertEqual(-first, Weight([-1, 2, -3]))
+        self.assertEqual(2 * first, Weight([2, -4, 6]))
+        self.assertEqual(first * 3, Weight([3, -6, 9]))
+        self.assertEqual(first.concat(second), Weight([1, -2, 3, 0, 4, -1]))
+        self.assertIsInstance(first + second, Weight)
+        self.assertIsInstance(first[1:], Weight)
+
+    def test_components(self):
+        weight = Weight([2, 0, -1])
+
+        self.assertEqual(weight.components, (2, 0, -1))
+        self.assertEqual(hash(weight), hash((2, 0, -1)))
+        self.assertEqual(str(weight), "(2 0 -1)")
+        self.assertEqual(pickle.loads(pickle.dumps(weight)), weight)
+
+
+class TestWeightBox(unittest.TestCase):
+    def test_offsets(self):
+        weights = [Weight([1, -2]), Weight([-1, 3]), Weight([0, 0])]
+        lower, upper = WeightBox.bounds(weights)
+
+        self.assertEqual((lower, upper), (Weight([-1, -2]), Weight([1, 3])))
+
+        box = WeightBox(lower + lower, upper + upper)
+        self.assertEqual(box.volume, 5 * 11)
+
+        for first in weights:
+            for second in weights:
+                self.assertEqual(
+                    box.weight(
+                        box.offset(first, lower) + box.offset(second, lower)
+                    ),
+                    first + second
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+from basisgen.young import (
+    partition_from_dynkin, dynkin_from_partition, littlewood_richardson,
+    integer_partitions, conjugate_partition, centralizer_order,
+    symmetric_group_character, schur_dimension, schur_dimension_polynomial
+)
+
+import math
+import unittest
+from fractions import Fraction
+
+
+class TestYoung(unittest.TestCase):
+    def test_partitions(self):
+        self.assertEqual(partition_from_dynkin((1, 0, 2)), (3, 2, 2))
+        self.assertEqual(partition_from_dynkin((0, 0)), (0, 0))
+        self.assertEqual(dynkin_from_partition((3, 2, 2), 3), (1, 0, 2))
+        self.assertEqual(dynkin_from_partition((2, 2, 2), 2), (0, 0))
+        self.assertEqual(dynkin_from_partition((), 2), (0, 0))
+
+    def test_littlewood_richardson(self):
+        self.assertEqual(
+            littlewood_richardson((2, 1), (2, 1), 3),
+            {(4, 2): 1, (4, 1, 1): 1, (3, 3): 1, (3, 2, 1): 2, (2, 2, 2): 1}
+        )
+        self.assertEqual(
+            littlewood_richardson((1,), (1,), 2),
+            {(2,): 1, (1, 1): 1}
+        )
+        self.assertEqual(
+            littlewood_richardson((1, 1), (1,), 2),
+            {(2, 1): 1}
+        )
+        self.assertEqual(littlewood_richardson((1, 1, 1), (1,), 2), {})
+
+    def test_symmetric_group_characters(self):
+        self.assertEqual(
+            integer_partitions(4),
+            [(4,), (3, 1), (2, 2), (2, 1, 1), (1, 1, 1, 1)]
+        )
+        self.assertEqual(conjugate_partition((3, 1)), (2, 1, 1))
+        self.assertEqual(symmetric_group_character((2, 1), (3,)), -1)
+        self.assertEqual(symmetric_group_character((2, 2), (2, 2)), 2)
+
+        for n in range(1, 7):
+            self.assertEqual(
+                sum(
+                    Fraction(1, centralizer_order(cycle_type))
+                    for cycle_type in integer_partitions(n)
+                ),
+                1
+            )
+
+            for partition in integer_partitions(n):
+                self.assertEqual(
+                    sum(
+                        Fraction(
+                            symmetric_group_character(
+                                partition, cycle_type
+                            )**2,
+                            centralizer_order(cycle_type)
+                        )
+                        for cycle_type in integer_partitions(n)
+                    ),
+                    1
+                )
+
+    def test_schur_dimensions(self):
+        self.assertEqual(schur_dimension((2, 1), 3), 8)
+        self.assertEqual(schur_dimension((1, 1, 1, 1), 3), 0)
+        self.assertEqual(
+            schur_dimension_polynomial((1, 1)),
+            [0, Fraction(-1, 2), Fraction(1, 2)]
+        )
+
+        for partition in integer_partitions(4):
+            polynomial = schur_dimension_polynomial(partition)
+            for n in range(5):
+                self.assertEqual(
+                    sum(
+                        coefficient * n**power
+                        for power, coefficient in enumerate(polynomial)
+                    ),
+                    schur_dimension(partition, n)
+                )
+
+        self.assertEqual(
+            sum(
+                schur_dimension(partition, 3)
+                * symmetric_group_character(partition, (1, 1, 1, 1))
+                for partition in integer_partitions(4)
+            ),
+            3**4
+        )
+        self.assertEqual(math.factorial(4), centralizer_order((1,) * 4))